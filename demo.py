@@ -10,6 +10,16 @@ from pathlib import Path
 from mcpconf import MCPServerRegistry, RegistrySchema
 from mcpconf.schema import ServerEntry, ServerConfig, TransportType, DeploymentType, Capabilities
 
+# Use orjson's C serializer for demo output when available
+try:
+    import orjson
+
+    def dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+except ImportError:
+    def dumps_pretty(obj):
+        return json.dumps(obj, indent=2, sort_keys=True)
+
 
 def demo_basic_usage():
     """Demonstrate basic registry usage."""
@@ -59,14 +69,14 @@ def demo_format_conversion():
     # Convert weather server to Claude Desktop format
     claude_config = registry.to_claude_desktop("weather-local")
     print("Claude Desktop format for weather-local:")
-    print(json.dumps(claude_config, indent=2))
+    print(dumps_pretty(claude_config))
     print()
     
     # Convert remote server to GitHub MCP format
     try:
         github_config = registry.to_github_mcp("sentry-remote")
         print("GitHub MCP format for sentry-remote:")
-        print(json.dumps(github_config, indent=2))
+        print(dumps_pretty(github_config))
     except Exception as e:
         print(f"GitHub conversion error: {e}")
     print()
@@ -87,7 +97,7 @@ def demo_claude_desktop_import():
         claude_config = json.load(f)
     
     print("Original Claude Desktop config:")
-    print(json.dumps(claude_config, indent=2))
+    print(dumps_pretty(claude_config))
     print()
     
     # Import into registry
@@ -3,8 +3,24 @@
 __version__ = "1.0.0"
 __author__ = "Claude Code"
 
-from .converters import FormatConverter
-from .registry import MCPServerRegistry
-from .schema import RegistrySchema
-
 __all__ = ["MCPServerRegistry", "RegistrySchema", "FormatConverter"]
+
+# Map public names to their defining submodules so `import mcpconf` stays
+# cheap; the heavy modules (and PyYAML) load on first attribute access.
+_SUBMODULES = {
+    "MCPServerRegistry": "registry",
+    "RegistrySchema": "schema",
+    "FormatConverter": "converters",
+}
+
+
+def __getattr__(name):
+    """Lazily import public classes on first access (PEP 562)."""
+    if name in _SUBMODULES:
+        from importlib import import_module
+
+        module = import_module(f".{_SUBMODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,29 +1,80 @@
 """Command-line interface for MCP server registry management."""
 
 import argparse
+import functools
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-import yaml  # type: ignore[import-untyped]
-
 from .registry import MCPServerRegistry
 from .schema import RegistrySchema, ServerEntry
 
+# JSON output helper: orjson serializes in C and is several times faster
+# than the stdlib encoder, but remains an optional dependency.
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def _dumps(obj) -> str:
+        """Serialize obj to pretty-printed JSON with sorted keys."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+    def _dumps_compact(obj) -> str:
+        """Serialize obj to compact single-line JSON."""
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize obj to pretty-printed JSON with sorted keys."""
+        return json.dumps(obj, indent=2, ensure_ascii=False, check_circular=False, sort_keys=True)
+
+    def _dumps_compact(obj) -> str:
+        """Serialize obj to compact single-line JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, check_circular=False)
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry(path_str: str, mtime_ns: int) -> MCPServerRegistry:
+    """Load a registry, cached by absolute path and modification time."""
+    return MCPServerRegistry(path_str)
+
+
+def get_registry(args) -> MCPServerRegistry:
+    """Return a registry for the --registry argument, reusing cached instances.
+
+    The cache is keyed on (absolute path, mtime) so back-to-back commands
+    against an unchanged registry file skip the reparse. Commands that write
+    the registry (import) bypass this and construct their own instance.
+    """
+    path = os.path.abspath(args.registry)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Missing file: fall back to an uncached empty registry
+        return MCPServerRegistry(args.registry)
+    return _load_registry(path, mtime_ns)
+
 
 def format_server_info(server_id: str, server: ServerEntry, detailed: bool = False) -> str:
     """Format server information for display."""
+    deployment = server.deployment.value
+    transport = server.config.transport.value
+
     if not detailed:
-        return f"{server_id:20} {server.deployment.value:8} {server.config.transport.value:8} {server.description}"
-    
+        return f"{server_id:20} {deployment:8} {transport:8} {server.description}"
+
     lines = [
         f"Server: {server_id}",
         f"Name: {server.name}",
         f"Description: {server.description}",
         f"Version: {server.version}",
-        f"Deployment: {server.deployment.value}",
-        f"Transport: {server.config.transport.value}",
+        f"Deployment: {deployment}",
+        f"Transport: {transport}",
     ]
     
     if server.license:
@@ -68,28 +119,45 @@ def format_server_info(server_id: str, server: ServerEntry, detailed: bool = Fal
 
 def cmd_list(args) -> None:
     """List servers command."""
-    registry = MCPServerRegistry(args.registry)
-    servers = registry.list_servers(deployment=args.deployment, category=args.category)
-    
-    if not servers:
+    registry = get_registry(args)
+
+    if getattr(args, "json", False):
+        # Machine-readable mode: one serialization call, one write
+        rows = [
+            {
+                "id": sid,
+                "deployment": server.deployment.value,
+                "transport": server.config.transport.value,
+                "description": server.description,
+            }
+            for sid, server in registry.iter_filtered(deployment=args.deployment,
+                                                      category=args.category)
+        ]
+        sys.stdout.write(_dumps_compact(rows) + "\n")
+        return
+
+    rows = list(registry.iter_filtered(deployment=args.deployment, category=args.category))
+
+    if not rows:
         print("No servers found.")
         return
-    
-    if not args.detailed:
-        print(f"{'NAME':<20} {'DEPLOY':<8} {'TRANSPORT':<10} {'DESCRIPTION'}")
-        print("-" * 70)
-    
-    for server_id in servers:
-        server = registry.get_server(server_id)
-        if server:
-            print(format_server_info(server_id, server, args.detailed))
-            if args.detailed and server_id != servers[-1]:
-                print()
+
+    write = sys.stdout.write
+    if args.detailed:
+        write("\n\n".join(format_server_info(sid, server, detailed=True)
+                          for sid, server in rows) + "\n")
+    else:
+        write(f"{'NAME':<20} {'DEPLOY':<8} {'TRANSPORT':<10} {'DESCRIPTION'}\n")
+        write("-" * 70 + "\n")
+        sys.stdout.writelines(
+            f"{sid:20} {server.deployment.value:8} {server.config.transport.value:8} {server.description}\n"
+            for sid, server in rows
+        )
 
 
 def cmd_show(args) -> None:
     """Show server details command."""
-    registry = MCPServerRegistry(args.registry)
+    registry = get_registry(args)
     server = registry.get_server(args.server)
     
     if not server:
@@ -101,7 +169,7 @@ def cmd_show(args) -> None:
 
 def cmd_search(args) -> None:
     """Search servers command."""
-    registry = MCPServerRegistry(args.registry)
+    registry = get_registry(args)
     results = registry.search_servers(args.query)
     
     if not results:
@@ -118,35 +186,45 @@ def cmd_search(args) -> None:
             print(format_server_info(server_id, server))
 
 
+# Static dispatch table for convert formats; resolved once instead of
+# re-walking an if/elif chain per invocation
+_CONVERTERS = {
+    "claude": MCPServerRegistry.to_claude_desktop,
+    "github": MCPServerRegistry.to_github_mcp,
+    "dxt": MCPServerRegistry.to_dxt_manifest,
+    "hosts": MCPServerRegistry.to_hosts_format,
+}
+
+
 def cmd_convert(args) -> None:
     """Convert server configuration command."""
-    registry = MCPServerRegistry(args.registry)
-    
+    registry = get_registry(args)
+
+    converter = _CONVERTERS.get(args.format)
+    if converter is None:
+        print(f"Unknown format: {args.format}")
+        sys.exit(1)
+
     try:
-        if args.format == "claude":
-            result = registry.to_claude_desktop(args.server)
-        elif args.format == "github":
-            result = registry.to_github_mcp(args.server)
-        elif args.format == "dxt":
-            result = registry.to_dxt_manifest(args.server)
-        elif args.format == "hosts":
-            result = registry.to_hosts_format(args.server)  # type: ignore[assignment]
+        result = converter(registry, args.server)
+
+        if args.format == "hosts":
             print(result)
             return
-        else:
-            print(f"Unknown format: {args.format}")
-            sys.exit(1)
-        
+
         if args.output:
             with open(args.output, 'w') as f:
                 if args.output.endswith('.yaml') or args.output.endswith('.yml'):
-                    yaml.dump(result, f, default_flow_style=False, indent=2)
+                    import yaml  # type: ignore[import-untyped]
+
+                    from .schema import YamlDumper
+                    yaml.dump(result, f, Dumper=YamlDumper, default_flow_style=False, indent=2)
                 else:
-                    json.dump(result, f, indent=2)
+                    f.write(_dumps(result))
             print(f"Configuration written to {args.output}")
         else:
-            print(json.dumps(result, indent=2))
-    
+            print(_dumps(result))
+
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -154,7 +232,7 @@ def cmd_convert(args) -> None:
 
 def cmd_validate(args) -> None:
     """Validate server configuration command."""
-    registry = MCPServerRegistry(args.registry)
+    registry = get_registry(args)
     
     if args.server:
         # Validate specific server
@@ -167,25 +245,21 @@ def cmd_validate(args) -> None:
         else:
             print(f"Server '{args.server}' is valid.")
     else:
-        # Validate all servers
-        all_valid = True
-        for server_id in registry.list_servers():
-            errors = registry.validate_server(server_id)
-            if errors:
-                all_valid = False
-                print(f"Validation errors for '{server_id}':")
-                for field, error in errors.items():
-                    print(f"  {field}: {error}")
-        
-        if all_valid:
-            print("All servers are valid.")
-        else:
+        # Validate all servers in a single registry pass
+        invalid = registry.validate_all()
+        for server_id in sorted(invalid):
+            print(f"Validation errors for '{server_id}':")
+            for field, error in invalid[server_id].items():
+                print(f"  {field}: {error}")
+
+        if invalid:
             sys.exit(1)
+        print("All servers are valid.")
 
 
 def cmd_categories(args) -> None:
     """List categories command."""
-    registry = MCPServerRegistry(args.registry)
+    registry = get_registry(args)
     categories = registry.get_categories()
     
     if not categories:
@@ -198,20 +272,40 @@ def cmd_categories(args) -> None:
 
 def cmd_import(args) -> None:
     """Import from Claude Desktop configuration command."""
-    if not Path(args.config).exists():
+    try:
+        with open(args.config, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = bytes(mm)
+            except ValueError:
+                # Empty files cannot be mapped
+                data = b""
+    except FileNotFoundError:
         print(f"Configuration file not found: {args.config}")
         sys.exit(1)
-    
-    with open(args.config, 'r') as f:
-        if args.config.endswith('.yaml') or args.config.endswith('.yml'):
-            config = yaml.safe_load(f)
-        else:
-            config = json.load(f)
-    
-    # Initialize registry, creating empty if file doesn't exist
+
+    # Probe the format from the content: JSON documents start with { or [,
+    # everything else goes through the YAML loader (a superset of JSON)
+    if data.lstrip()[:1] in (b"{", b"["):
+        config = _loads(data)
+    else:
+        import yaml  # type: ignore[import-untyped]
+
+        from .schema import YamlLoader
+        config = yaml.load(data, Loader=YamlLoader)
+
+    # An empty file parses to None and junk parses to a scalar; fail with
+    # a clear message instead of crashing inside the import
+    if not isinstance(config, dict):
+        print(f"Invalid or empty configuration file: {args.config}")
+        sys.exit(1)
+
+    # Initialize registry, loading the existing file if there is one
     registry = MCPServerRegistry()
-    if Path(args.registry).exists():
+    try:
         registry.load_registry(args.registry)
+    except FileNotFoundError:
+        pass
     registry.registry_path = Path(args.registry)
     
     count = registry.import_claude_desktop(config)
@@ -223,8 +317,65 @@ def cmd_import(args) -> None:
         print(f"Imported {count} servers (not saved, use --save to persist).")
 
 
-def main():
-    """Main CLI entry point."""
+# Flag-free subcommands that can skip argparse construction entirely:
+# command name -> (handler, expected positional argument count)
+_FAST_COMMANDS = {
+    "list": (cmd_list, 0),
+    "show": (cmd_show, 1),
+    "search": (cmd_search, 1),
+    "categories": (cmd_categories, 0),
+}
+
+_DEFAULT_REGISTRY = "mcp-registry.yaml"
+
+
+def _fast_parse(argv) -> Optional[argparse.Namespace]:
+    """Parse common flag-free invocations without building the argparse tree.
+
+    Building the full subparser tree costs more than the actual work for
+    one-shot commands like `mcpconf list`. Returns None for anything that
+    needs the real parser (flags present, wrong arity, other commands).
+    """
+    if not argv or argv[0] not in _FAST_COMMANDS:
+        return None
+    if any(arg.startswith("-") for arg in argv):
+        return None
+
+    func, n_positional = _FAST_COMMANDS[argv[0]]
+    positional = argv[1:]
+    if len(positional) != n_positional:
+        return None
+
+    args = argparse.Namespace(
+        command=argv[0],
+        func=func,
+        registry=_DEFAULT_REGISTRY,
+        deployment=None,
+        category=None,
+        detailed=False,
+    )
+    if argv[0] == "show":
+        args.server = positional[0]
+    elif argv[0] == "search":
+        args.query = positional[0]
+
+    return args
+
+
+def main(argv=None):
+    """Main CLI entry point. argv defaults to sys.argv[1:]."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = _fast_parse(argv)
+    if args is not None:
+        try:
+            args.func(args)
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
     parser = argparse.ArgumentParser(
         description="MCP Server Registry Management",
         prog="mcpconf"
@@ -242,6 +393,7 @@ def main():
     list_parser.add_argument("--deployment", choices=["local", "remote", "hybrid"], help="Filter by deployment type")
     list_parser.add_argument("--category", help="Filter by category")
     list_parser.add_argument("--detailed", "-d", action="store_true", help="Show detailed information")
+    list_parser.add_argument("--json", action="store_true", help="Output as JSON for scripting")
     list_parser.set_defaults(func=cmd_list)
     
     # Show command
@@ -276,7 +428,7 @@ def main():
     import_parser.add_argument("--save", action="store_true", help="Save to registry after import")
     import_parser.set_defaults(func=cmd_import)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
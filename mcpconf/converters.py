@@ -1,75 +1,157 @@
 """Format conversion utilities for different MCP client configurations."""
 
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .schema import ServerEntry, TransportType
 
+# Fixed strings for imported entries, hoisted out of the per-server loop
+_DEFAULT_IMPORT_DESC = "Imported from Claude Desktop configuration"
+_DEFAULT_IMPORT_VERSION = "1.0.0"
+
+# Matches an env var name ending in KEY or TOKEN when the names are joined
+# with NUL separators (NUL cannot appear in an env var name), letting one
+# C-level regex scan replace a Python loop over the keys
+_AUTH_ENV_RE = re.compile(r"(?:KEY|TOKEN)\x00")
+
+# HTTP-style transports share conversion logic; frozenset gives an O(1)
+# membership check against the enum singletons
+_HTTP_TRANSPORTS = frozenset({TransportType.HTTP, TransportType.HTTPS})
+
+# Maps launch commands to DXT runtime types; unknown commands default to
+# "node". Extend here as new runtimes appear in the ecosystem.
+_COMMAND_RUNTIME = {
+    "python": "python",
+    "python3": "python",
+    "uv": "python",
+    "uvx": "python",
+    "node": "node",
+    "npx": "node",
+    "bun": "node",
+    "deno": "node",
+}
+
+# Fixed portion of every DXT manifest; merged (C-level) with the variable
+# fields per conversion instead of rebuilding the whole dict key by key
+_DXT_SKELETON = {"dxt_version": "1.0"}
+
+# Conversion outputs are pure functions of (entry content, server_id), so
+# repeated conversions of an unchanged entry can be served from a cache.
+# Cached results are shared; callers must treat them as read-only.
+_conversion_cache: Dict[Tuple[str, bytes, str], Any] = {}
+_CONVERSION_CACHE_MAX = 256
+
+
+def _cached_convert(format_name: str, server: ServerEntry, server_id: str,
+                    build: Callable[[], Any]) -> Any:
+    """Memoize a conversion result keyed on the entry's content hash."""
+    key = (format_name, server.content_hash, server_id)
+    try:
+        return _conversion_cache[key]
+    except KeyError:
+        result = build()
+        if len(_conversion_cache) >= _CONVERSION_CACHE_MAX:
+            _conversion_cache.clear()
+        _conversion_cache[key] = result
+        return result
+
 
 class FormatConverter:
     """Convert registry entries to various client configuration formats."""
-    
+
     @staticmethod
     def to_claude_desktop(server: ServerEntry, server_id: str) -> Dict[str, Any]:
         """Convert server entry to Claude Desktop format."""
-        result: Dict[str, Any] = {"mcpServers": {}}
+        return _cached_convert(
+            "claude", server, server_id,
+            lambda: FormatConverter._build_claude_desktop(server, server_id))
+
+    @staticmethod
+    def _build_claude_desktop(server: ServerEntry, server_id: str) -> Dict[str, Any]:
+        """Build the Claude Desktop output (uncached)."""
+        return {"mcpServers": {server_id: FormatConverter._claude_server_config(server.config)}}
+
+    @staticmethod
+    def _claude_server_config(config) -> Dict[str, Any]:
+        """Build the per-server body of a Claude Desktop config."""
+        transport = config.transport
         server_config: Dict[str, Any] = {}
-        
-        if server.config.transport == TransportType.STDIO:
-            if server.config.command:
-                server_config["command"] = server.config.command
-            if server.config.args:
-                server_config["args"] = server.config.args
-            if server.config.env:
-                server_config["env"] = server.config.env
-        elif server.config.transport in [TransportType.HTTP, TransportType.HTTPS]:
-            if server.config.url:
-                server_config["url"] = server.config.url
-            if server.config.headers:
-                server_config["headers"] = server.config.headers
-        
-        result["mcpServers"][server_id] = server_config
-        return result
+
+        if transport is TransportType.STDIO:
+            if config.command:
+                server_config["command"] = config.command
+            if config.args:
+                server_config["args"] = config.args
+            if config.env:
+                server_config["env"] = config.env
+        elif transport in _HTTP_TRANSPORTS:
+            if config.url:
+                server_config["url"] = config.url
+            if config.headers:
+                server_config["headers"] = config.headers
+
+        return server_config
+
+    @staticmethod
+    def to_claude_desktop_many(servers: Dict[str, ServerEntry]) -> Dict[str, Any]:
+        """Convert many entries into one combined Claude Desktop config.
+
+        A single call over a mapping of server_id -> ServerEntry amortizes
+        the per-call overhead of to_claude_desktop and yields the merged
+        {"mcpServers": {...}} document directly.
+        """
+        return {"mcpServers": {
+            server_id: FormatConverter._claude_server_config(server.config)
+            for server_id, server in servers.items()
+        }}
     
     @staticmethod
     def to_github_mcp(server: ServerEntry, server_id: str) -> Dict[str, Any]:
         """Convert server entry to GitHub MCP format."""
-        result: Dict[str, Any] = {"servers": {}}
-        
-        if server.config.transport in [TransportType.HTTP, TransportType.HTTPS]:
-            server_config: Dict[str, Any] = {
-                "type": "http",
-                "url": server.config.url
-            }
-            if server.config.headers:
-                server_config["headers"] = server.config.headers
-            
-            result["servers"][server_id] = server_config
-        else:
-            raise ValueError(f"GitHub MCP format only supports HTTP transport, got {server.config.transport}")
-        
-        return result
+        return _cached_convert(
+            "github", server, server_id,
+            lambda: FormatConverter._build_github_mcp(server, server_id))
+
+    @staticmethod
+    def _build_github_mcp(server: ServerEntry, server_id: str) -> Dict[str, Any]:
+        """Build the GitHub MCP output (uncached)."""
+        config = server.config
+        if config.transport not in _HTTP_TRANSPORTS:
+            raise ValueError(f"GitHub MCP format only supports HTTP transport, got {config.transport}")
+
+        server_config: Dict[str, Any] = {
+            "type": "http",
+            "url": config.url
+        }
+        if config.headers:
+            server_config["headers"] = config.headers
+
+        return {"servers": {server_id: server_config}}
     
     @staticmethod
     def to_dxt_manifest(server: ServerEntry, server_id: str) -> Dict[str, Any]:
         """Convert server entry to DXT manifest format."""
-        if server.config.transport != TransportType.STDIO:
-            raise ValueError(f"DXT manifest only supports stdio transport, got {server.config.transport}")
-        
+        return _cached_convert(
+            "dxt", server, server_id,
+            lambda: FormatConverter._build_dxt_manifest(server, server_id))
+
+    @staticmethod
+    def _build_dxt_manifest(server: ServerEntry, server_id: str) -> Dict[str, Any]:
+        """Build the DXT manifest output (uncached)."""
+        config = server.config
+        if config.transport is not TransportType.STDIO:
+            raise ValueError(f"DXT manifest only supports stdio transport, got {config.transport}")
+
         # Determine runtime type from command
-        runtime_type = "node"
-        if server.config.command in ["python", "python3", "uv", "uvx"]:
-            runtime_type = "python"
-        
-        mcp_config: Dict[str, Any] = {}
-        if server.config.command:
-            mcp_config["command"] = server.config.command
-        if server.config.args:
-            mcp_config["args"] = server.config.args
-        if server.config.env:
-            mcp_config["env"] = server.config.env
-        
-        result: Dict[str, Any] = {
-            "dxt_version": "1.0",
+        runtime_type = _COMMAND_RUNTIME.get(config.command, "node")
+
+        mcp_config: Dict[str, Any] = {
+            key: value
+            for key, value in (("command", config.command), ("args", config.args), ("env", config.env))
+            if value
+        }
+
+        result: Dict[str, Any] = _DXT_SKELETON | {
             "name": server_id,
             "display_name": server.name,
             "version": server.version,
@@ -109,80 +191,83 @@ class FormatConverter:
     @staticmethod
     def to_hosts_format(server: ServerEntry, server_id: str) -> str:
         """Convert server entry to Linux hosts file style format."""
-        parts = [server_id, server.deployment.value, server.config.transport.value]
-        
-        # Add endpoint
-        if server.config.transport == TransportType.STDIO and server.config.command:
-            if server.config.args:
-                endpoint = f"{server.config.command}:{':'.join(server.config.args)}"
+        return _cached_convert(
+            "hosts", server, server_id,
+            lambda: FormatConverter._build_hosts_format(server, server_id))
+
+    @staticmethod
+    def _build_hosts_format(server: ServerEntry, server_id: str) -> str:
+        """Build the hosts file output (uncached)."""
+        config = server.config
+        env = config.env
+        headers = config.headers
+
+        # Endpoint
+        if config.transport is TransportType.STDIO and config.command:
+            if config.args:
+                endpoint = f"{config.command}:{':'.join(config.args)}"
             else:
-                endpoint = server.config.command
-        elif server.config.url:
-            endpoint = server.config.url
+                endpoint = config.command
+        elif config.url:
+            endpoint = config.url
         else:
             endpoint = "unknown"
-        
-        parts.append(endpoint)
-        
-        # Add options
-        options = []
-        
-        # Check for auth in headers or environment
-        has_auth = False
-        if server.config.headers and "Authorization" in server.config.headers:
-            auth_header = server.config.headers["Authorization"]
-            if auth_header.startswith("Bearer"):
-                options.append("auth=bearer")
-            else:
-                options.append("auth=key")
-            has_auth = True
-        elif server.config.env and any(key.endswith("KEY") or key.endswith("TOKEN") for key in server.config.env.keys()):
-            options.append("auth=key")
-            has_auth = True
-        
-        if server.config.env:
-            env_vars = ",".join(server.config.env.keys())
-            options.append(f"env={env_vars}")
-        
-        if server.security and server.security.sandbox:
-            options.append("sandbox=true")
-        
+
+        parts = [server_id, server.deployment.value, config.transport.value, endpoint]
+
+        # Options: auth, env, sandbox (in that order)
+        auth_opt = None
+        if headers and "Authorization" in headers:
+            auth_opt = "auth=bearer" if headers["Authorization"].startswith("Bearer") else "auth=key"
+        elif env and _AUTH_ENV_RE.search("\x00".join(env) + "\x00"):
+            auth_opt = "auth=key"
+
+        env_opt = f"env={','.join(env)}" if env else None
+        sandbox_opt = "sandbox=true" if server.security and server.security.sandbox else None
+
+        options = [opt for opt in (auth_opt, env_opt, sandbox_opt) if opt]
         if options:
             parts.append(" ".join(options))
-        
+
         return " ".join(parts)
     
     @staticmethod
     def from_claude_desktop(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Convert Claude Desktop format to registry format."""
-        servers: Dict[str, Dict[str, Any]] = {}
-        
-        if "mcpServers" not in config:
-            return servers
-        
-        for server_id, server_config in config["mcpServers"].items():
-            registry_entry = {
-                "name": server_id.replace("-", " ").title(),
-                "description": f"Imported from Claude Desktop configuration",
-                "version": "1.0.0",
-                "deployment": "local" if "command" in server_config else "remote",
-                "config": {}
+        mcp_servers = config.get("mcpServers")
+        if not mcp_servers:
+            return {}
+
+        return {
+            server_id: FormatConverter._entry_from_claude_config(server_id, server_config)
+            for server_id, server_config in mcp_servers.items()
+        }
+
+    @staticmethod
+    def _entry_from_claude_config(server_id: str, server_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a single registry entry from a Claude Desktop server config."""
+        entry_config: Dict[str, Any]
+
+        if "command" in server_config:
+            entry_config = {"transport": "stdio"}
+            entry_config.update(
+                (k, server_config[k]) for k in ("command", "args", "env") if k in server_config
+            )
+        elif "url" in server_config:
+            url = server_config["url"]
+            entry_config = {
+                "transport": "https" if url.startswith("https") else "http",
+                "url": url,
             }
-            
-            if "command" in server_config:
-                registry_entry["config"]["transport"] = "stdio"
-                registry_entry["config"]["command"] = server_config["command"]
-                if "args" in server_config:
-                    registry_entry["config"]["args"] = server_config["args"]
-                if "env" in server_config:
-                    registry_entry["config"]["env"] = server_config["env"]
-            elif "url" in server_config:
-                url = server_config["url"]
-                registry_entry["config"]["transport"] = "https" if url.startswith("https") else "http"
-                registry_entry["config"]["url"] = url
-                if "headers" in server_config:
-                    registry_entry["config"]["headers"] = server_config["headers"]
-            
-            servers[server_id] = registry_entry
-        
-        return servers
\ No newline at end of file
+            if "headers" in server_config:
+                entry_config["headers"] = server_config["headers"]
+        else:
+            entry_config = {}
+
+        return {
+            "name": server_id.replace("-", " ").title(),
+            "description": _DEFAULT_IMPORT_DESC,
+            "version": _DEFAULT_IMPORT_VERSION,
+            "deployment": "local" if "command" in server_config else "remote",
+            "config": entry_config,
+        }
\ No newline at end of file
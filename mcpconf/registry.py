@@ -2,37 +2,124 @@
 
 import json
 import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Union
 
 import yaml  # type: ignore[import-untyped]
 
+from . import __version__
 from .converters import FormatConverter
-from .schema import DeploymentType, Registry, RegistrySchema, ServerEntry
+from .schema import DeploymentType, Registry, RegistrySchema, ServerEntry, YamlDumper, orjson
+
+# Field specs for _server_to_dict: optional config keys, then the optional
+# sections with their keys. All are emitted only when truthy;
+# requirements.network is special-cased because False is meaningful.
+_CONFIG_OPT_FIELDS = ("command", "args", "url", "headers", "env", "working_dir")
+_OPT_SECTIONS = (
+    ("capabilities", ("tools", "resources", "prompts")),
+    ("requirements", ("platforms", "runtimes", "dependencies")),
+    ("security", ("requires_auth", "permissions", "sandbox")),
+    ("compatibility", ("claude_desktop", "mcpconf")),
+)
+
+# Shared empty view returned when no categories exist
+_EMPTY_CATEGORIES: Mapping[str, List[str]] = MappingProxyType({})
 
 
 class MCPServerRegistry:
     """Main registry class for managing MCP server configurations."""
-    
+
     def __init__(self, registry_path: Optional[Union[str, Path]] = None):
         """Initialize registry from file or create empty registry."""
         self.registry_path = Path(registry_path) if registry_path else None
         self.registry = None
-        
+        self._search_blobs: Optional[Dict[str, str]] = None
+        # Parallel set view of registry.categories for O(1) membership
+        # checks; the lists stay authoritative for serialization order.
+        self._category_sets: Dict[str, Set[str]] = {}
+        # Mutation counter; bumped by every mutating method so read-path
+        # caches keyed on it invalidate without explicit bookkeeping.
+        self._rev = 0
+        self._list_cache: Dict[tuple, List[str]] = {}
+        self._list_cache_rev = -1
+
         if self.registry_path and self.registry_path.exists():
             self.load_registry()
         else:
             self.registry = Registry(version="1.0", servers={})
     
-    def load_registry(self, registry_path: Optional[Union[str, Path]] = None) -> None:
-        """Load registry from file."""
+    def load_registry(self, registry_path: Optional[Union[str, Path]] = None,
+                      use_cache: bool = True) -> None:
+        """Load registry from file.
+
+        When use_cache is True, a pickle sidecar (<registry>.cache) keyed on
+        the source file's mtime and size plus the mcpconf version is
+        consulted first and refreshed after a full parse, so unchanged
+        registries load without reparsing.
+        """
         if registry_path:
             self.registry_path = Path(registry_path)
-        
+
         if not self.registry_path or not self.registry_path.exists():
             raise FileNotFoundError(f"Registry file not found: {self.registry_path}")
-        
+
+        stat = self.registry_path.stat()
+        # The version stamp invalidates sidecars written by a different
+        # mcpconf release, whose schema or validation rules may differ
+        cache_key = (__version__, stat.st_mtime_ns, stat.st_size)
+        cache_path = self.registry_path.with_suffix(self.registry_path.suffix + ".cache")
+
+        if use_cache:
+            cached = self._read_cache(cache_path, cache_key)
+            if cached is not None:
+                self.registry = cached
+                self._invalidate_search_index()
+                self._category_sets = {}
+                self._rev += 1
+                return
+
         self.registry = RegistrySchema.load_from_file(str(self.registry_path))
+        self._invalidate_search_index()
+        self._category_sets = {}
+        self._rev += 1
+
+        if use_cache:
+            self._write_cache(cache_path, cache_key)
+
+    @staticmethod
+    def _read_cache(cache_path: Path, cache_key) -> Optional[Registry]:
+        """Return the cached Registry if the sidecar matches cache_key, else None."""
+        try:
+            with open(cache_path, 'rb') as f:
+                stored_key, registry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            return None
+
+        if stored_key != cache_key or not isinstance(registry, Registry):
+            return None
+        return registry
+
+    def _write_cache(self, cache_path: Path, cache_key) -> None:
+        """Write the parsed registry to the sidecar atomically; best-effort.
+
+        A cache-write failure must never fail the load that triggered it,
+        so pickling errors are swallowed too and the temp file is removed.
+        """
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False) as f:
+                tmp_name = f.name
+                pickle.dump((cache_key, self.registry), f)
+            os.replace(tmp_name, cache_path)
+        except (OSError, pickle.PickleError):
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
     
     def save_registry(self, registry_path: Optional[Union[str, Path]] = None) -> None:
         """Save registry to file."""
@@ -48,13 +135,31 @@ class MCPServerRegistry:
         # Convert to dict for serialization
         data = self._registry_to_dict()
         
-        # Save as YAML or JSON based on extension
+        # Serialize to one bytes payload (YAML or JSON based on extension)
+        # so the file sees a single write instead of many small encoded ones
         if self.registry_path.suffix in ['.yaml', '.yml']:
-            with open(self.registry_path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, indent=2)
+            payload = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False,
+                                indent=2).encode()
+        elif orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
         else:
-            with open(self.registry_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            payload = json.dumps(data, indent=2, sort_keys=True).encode()
+
+        # Write via a temp file + rename so a failed save never leaves a
+        # truncated registry behind. NamedTemporaryFile creates 0600-only
+        # files, so carry over the existing registry's mode (or the umask
+        # default for a new file) before the rename.
+        try:
+            mode = self.registry_path.stat().st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+        with tempfile.NamedTemporaryFile(dir=self.registry_path.parent, delete=False) as f:
+            f.write(payload)
+            os.chmod(f.name, mode)
+        os.replace(f.name, self.registry_path)
     
     def add_server(self, server_id: str, server: ServerEntry) -> None:
         """Add or update server in registry."""
@@ -62,13 +167,17 @@ class MCPServerRegistry:
             self.registry = Registry(version="1.0", servers={})
         
         self.registry.servers[server_id] = server
-    
+        self._invalidate_search_index()
+        self._rev += 1
+
     def remove_server(self, server_id: str) -> bool:
         """Remove server from registry. Returns True if server was removed."""
         if not self.registry or server_id not in self.registry.servers:
             return False
-        
+
         del self.registry.servers[server_id]
+        self._invalidate_search_index()
+        self._rev += 1
         return True
     
     def get_server(self, server_id: str) -> Optional[ServerEntry]:
@@ -79,64 +188,121 @@ class MCPServerRegistry:
         return self.registry.servers.get(server_id)
     
     def list_servers(self, deployment: Optional[str] = None, category: Optional[str] = None) -> List[str]:
-        """List available servers, optionally filtered by deployment type or category."""
+        """List available servers, optionally filtered by deployment type or category.
+
+        Results are memoized per (deployment, category) until the registry
+        is next mutated, so repeated listings skip the sort entirely.
+        """
+        if self._list_cache_rev != self._rev:
+            self._list_cache.clear()
+            self._list_cache_rev = self._rev
+
+        key = (deployment, category)
+        cached = self._list_cache.get(key)
+        if cached is None:
+            if deployment is None and category is None:
+                # Unfiltered listing only needs ids; avoid touching the
+                # entries so lazily loaded servers stay unhydrated
+                cached = sorted(self.registry.servers) if self.registry else []
+            else:
+                cached = [server_id for server_id, _ in self.iter_filtered(deployment, category)]
+            self._list_cache[key] = cached
+        # Hand out a copy so callers mutating the result (as they could
+        # with the baseline's fresh lists) cannot poison the cache
+        return list(cached)
+
+    def iter_filtered(self, deployment: Optional[str] = None, category: Optional[str] = None):
+        """Yield (server_id, ServerEntry) pairs in sorted order, optionally filtered.
+
+        Single-pass alternative to list_servers + get_server for callers that
+        need the entries as well as the IDs.
+        """
         if not self.registry:
-            return []
-        
-        servers = list(self.registry.servers.keys())
-        
-        # Filter by deployment type
+            return
+
+        # Resolve filters once, outside the loop
+        dep_type = None
         if deployment:
             try:
                 dep_type = DeploymentType(deployment)
-                servers = [sid for sid in servers 
-                          if self.registry.servers[sid].deployment == dep_type]
             except ValueError:
-                return []
-        
-        # Filter by category
+                return
+
+        category_servers = None
         if category and self.registry.categories:
             category_servers = self.registry.categories.get(category, [])
-            servers = [sid for sid in servers if sid in category_servers]
-        
-        return sorted(servers)
+
+        servers = self.registry.servers
+        for server_id in sorted(servers):
+            server = servers[server_id]
+            if dep_type and server.deployment != dep_type:
+                continue
+            if category_servers is not None and server_id not in category_servers:
+                continue
+            yield server_id, server
     
     def search_servers(self, query: str) -> List[str]:
-        """Search servers by name, description, or capabilities."""
+        """Search servers by name, description, or capabilities.
+
+        Substring matching over per-server blobs precomputed on first
+        search: each server's searchable fields are joined and lowercased
+        once, so repeat queries are a single C-level scan per server.
+        """
         if not self.registry:
             return []
-        
+
+        if self._search_blobs is None:
+            self._build_search_index()
+
         query = query.lower()
-        results = []
-        
+        return sorted(sid for sid, blob in self._search_blobs.items() if query in blob)
+
+    def _build_search_index(self) -> None:
+        """Build the lowercased search blobs."""
+        blobs: Dict[str, str] = {}
+
         for server_id, server in self.registry.servers.items():
-            # Search in name and description
-            if (query in server.name.lower() or 
-                query in server.description.lower() or
-                query in server_id.lower()):
-                results.append(server_id)
-                continue
-            
-            # Search in capabilities
+            fields = [server_id, server.name, server.description]
             if server.capabilities:
-                if server.capabilities.tools and any(query in tool.lower() for tool in server.capabilities.tools):
-                    results.append(server_id)
-                    continue
-                if server.capabilities.resources and any(query in res.lower() for res in server.capabilities.resources):
-                    results.append(server_id)
-                    continue
-                if server.capabilities.prompts and any(query in prompt.lower() for prompt in server.capabilities.prompts):
-                    results.append(server_id)
-                    continue
-        
-        return sorted(results)
+                fields.extend(server.capabilities.tools or [])
+                fields.extend(server.capabilities.resources or [])
+                fields.extend(server.capabilities.prompts or [])
+
+            blobs[server_id] = "\n".join(fields).lower()
+
+        self._search_blobs = blobs
+
+    def _invalidate_search_index(self) -> None:
+        """Drop the search blobs; they are rebuilt lazily on the next search."""
+        self._search_blobs = None
     
-    def get_categories(self) -> Dict[str, List[str]]:
-        """Get all categories and their servers."""
+    def _category_set(self, category: str) -> Set[str]:
+        """Return the membership set for a category, rebuilding if stale.
+
+        The set is rebuilt from the list whenever the two disagree in size,
+        which covers external mutations of registry.categories.
+        """
+        members = self.registry.categories[category]
+        cached = self._category_sets.get(category)
+        if cached is None or len(cached) != len(members):
+            cached = set(members)
+            self._category_sets[category] = cached
+        return cached
+
+    def get_categories(self) -> Mapping[str, List[str]]:
+        """Get all categories and their servers as a read-only view.
+
+        The view tracks the live registry without copying; callers that
+        need to mutate the result should use get_categories_copy().
+        """
         if not self.registry or not self.registry.categories:
-            return {}
-        
-        return dict(self.registry.categories)
+            return _EMPTY_CATEGORIES
+
+        return MappingProxyType(self.registry.categories)
+
+    def get_categories_copy(self) -> Dict[str, List[str]]:
+        """Get an independent copy of the categories, safe to mutate."""
+        return {category: list(members) for category, members in self.get_categories().items()}
     
     def add_to_category(self, category: str, server_id: str) -> None:
         """Add server to category."""
@@ -148,9 +314,12 @@ class MCPServerRegistry:
         
         if category not in self.registry.categories:
             self.registry.categories[category] = []
-        
-        if server_id not in self.registry.categories[category]:
+
+        members = self._category_set(category)
+        if server_id not in members:
+            members.add(server_id)
             self.registry.categories[category].append(server_id)
+            self._rev += 1
     
     def remove_from_category(self, category: str, server_id: str) -> bool:
         """Remove server from category. Returns True if removed."""
@@ -158,74 +327,100 @@ class MCPServerRegistry:
             category not in self.registry.categories):
             return False
         
-        if server_id in self.registry.categories[category]:
+        members = self._category_set(category)
+        if server_id in members:
+            members.discard(server_id)
             self.registry.categories[category].remove(server_id)
-            
+
             # Remove category if empty
             if not self.registry.categories[category]:
                 del self.registry.categories[category]
-            
+                del self._category_sets[category]
+
+            self._rev += 1
             return True
-        
+
         return False
     
-    def to_claude_desktop(self, server_id: str) -> Dict:
-        """Convert server config to Claude Desktop format."""
+    def _converted(self, server_id: str, converter) -> Any:
+        """Look up a server and run a FormatConverter method on it.
+
+        The converter memoizes per (entry content, server_id), so repeated
+        conversions of an unchanged server return the cached result.
+        """
         server = self.get_server(server_id)
         if not server:
             raise ValueError(f"Server '{server_id}' not found")
-        
-        return FormatConverter.to_claude_desktop(server, server_id)
-    
+
+        return converter(server, server_id)
+
+    def to_claude_desktop(self, server_id: str) -> Dict:
+        """Convert server config to Claude Desktop format."""
+        return self._converted(server_id, FormatConverter.to_claude_desktop)
+
     def to_github_mcp(self, server_id: str) -> Dict:
         """Convert server config to GitHub MCP format."""
-        server = self.get_server(server_id)
-        if not server:
-            raise ValueError(f"Server '{server_id}' not found")
-        
-        return FormatConverter.to_github_mcp(server, server_id)
-    
+        return self._converted(server_id, FormatConverter.to_github_mcp)
+
     def to_dxt_manifest(self, server_id: str) -> Dict:
         """Convert server config to DXT manifest format."""
-        server = self.get_server(server_id)
-        if not server:
-            raise ValueError(f"Server '{server_id}' not found")
-        
-        return FormatConverter.to_dxt_manifest(server, server_id)
-    
+        return self._converted(server_id, FormatConverter.to_dxt_manifest)
+
     def to_hosts_format(self, server_id: str) -> str:
         """Convert server config to Linux hosts file format."""
-        server = self.get_server(server_id)
-        if not server:
-            raise ValueError(f"Server '{server_id}' not found")
-        
-        return FormatConverter.to_hosts_format(server, server_id)
+        return self._converted(server_id, FormatConverter.to_hosts_format)
     
     def import_claude_desktop(self, config: Dict) -> int:
         """Import servers from Claude Desktop configuration. Returns count of imported servers."""
         imported_servers = FormatConverter.from_claude_desktop(config)
-        
-        for server_id, server_data in imported_servers.items():
-            # Create ServerEntry from converted data
-            errors = RegistrySchema.validate_server_entry(server_data)
+
+        # Validate and construct in one pass, collecting warnings instead
+        # of printing inside the loop.
+        new_servers: Dict[str, ServerEntry] = {}
+        warnings = []
+        for server_id, server, errors in RegistrySchema.parse_many(imported_servers.items()):
             if errors:
-                print(f"Warning: Skipping server '{server_id}' due to validation errors: {errors}")
-                continue
-            
-            server = RegistrySchema.parse_server_entry(server_data)
-            self.add_server(server_id, server)
-        
+                warnings.append(f"Warning: Skipping server '{server_id}' due to validation errors: {errors}")
+            else:
+                new_servers[server_id] = server
+
+        if not self.registry:
+            self.registry = Registry(version="1.0", servers={})
+
+        if new_servers:
+            self.registry.servers.update(new_servers)
+            self._invalidate_search_index()
+            self._rev += 1
+
+        if warnings:
+            print("\n".join(warnings))
+
         return len(imported_servers)
     
+    def validate_all(self) -> Dict[str, Dict[str, str]]:
+        """Validate every server in one pass.
+
+        Returns a mapping of server_id to validation errors for the invalid
+        servers only; an empty dict means the whole registry is valid.
+        """
+        if not self.registry:
+            return {}
+
+        invalid = {}
+        for server_id, server in self.registry.servers.items():
+            errors = RegistrySchema.validate_entry(server)
+            if errors:
+                invalid[server_id] = errors
+
+        return invalid
+
     def validate_server(self, server_id: str) -> Dict[str, str]:
         """Validate server configuration and return any errors."""
         server = self.get_server(server_id)
         if not server:
             return {"server": "Server not found"}
-        
-        # Convert back to dict for validation
-        server_dict = self._server_to_dict(server)
-        return RegistrySchema.validate_server_entry(server_dict)
+
+        return RegistrySchema.validate_entry(server)
     
     def _registry_to_dict(self) -> Dict:
         """Convert registry object to dictionary for serialization."""
@@ -247,80 +442,36 @@ class MCPServerRegistry:
     
     def _server_to_dict(self, server: ServerEntry) -> Dict:
         """Convert ServerEntry to dictionary."""
+        config = server.config
+        config_dict: Dict[str, Any] = {"transport": config.transport.value}
+        config_dict.update(
+            (key, value) for key in _CONFIG_OPT_FIELDS if (value := getattr(config, key))
+        )
+        if config.timeout != 30:
+            config_dict["timeout"] = config.timeout
+
         result: Dict[str, Any] = {
             "name": server.name,
             "description": server.description,
             "version": server.version,
             "deployment": server.deployment.value,
-            "config": {
-                "transport": server.config.transport.value
-            }
+            "config": config_dict,
         }
-        
-        # Add optional config fields
-        if server.config.command:
-            result["config"]["command"] = server.config.command
-        if server.config.args:
-            result["config"]["args"] = server.config.args
-        if server.config.url:
-            result["config"]["url"] = server.config.url
-        if server.config.headers:
-            result["config"]["headers"] = server.config.headers
-        if server.config.env:
-            result["config"]["env"] = server.config.env
-        if server.config.working_dir:
-            result["config"]["working_dir"] = server.config.working_dir
-        if server.config.timeout != 30:
-            result["config"]["timeout"] = server.config.timeout
-        
+
         # Add optional top-level fields
         if server.license:
             result["license"] = server.license
         if server.source_url:
             result["source_url"] = server.source_url
-        
-        if server.capabilities:
-            caps = {}
-            if server.capabilities.tools:
-                caps["tools"] = server.capabilities.tools
-            if server.capabilities.resources:
-                caps["resources"] = server.capabilities.resources
-            if server.capabilities.prompts:
-                caps["prompts"] = server.capabilities.prompts
-            if caps:
-                result["capabilities"] = caps
-        
-        if server.requirements:
-            reqs: Dict[str, Any] = {}
-            if server.requirements.platforms:
-                reqs["platforms"] = server.requirements.platforms
-            if server.requirements.runtimes:
-                reqs["runtimes"] = server.requirements.runtimes
-            if server.requirements.dependencies:
-                reqs["dependencies"] = server.requirements.dependencies
-            if server.requirements.network is not None:
-                reqs["network"] = server.requirements.network
-            if reqs:
-                result["requirements"] = reqs
-        
-        if server.security:
-            sec: Dict[str, Any] = {}
-            if server.security.requires_auth:
-                sec["requires_auth"] = server.security.requires_auth
-            if server.security.permissions:
-                sec["permissions"] = server.security.permissions
-            if server.security.sandbox:
-                sec["sandbox"] = server.security.sandbox
-            if sec:
-                result["security"] = sec
-        
-        if server.compatibility:
-            compat = {}
-            if server.compatibility.claude_desktop:
-                compat["claude_desktop"] = server.compatibility.claude_desktop
-            if server.compatibility.mcpconf:
-                compat["mcpconf"] = server.compatibility.mcpconf
-            if compat:
-                result["compatibility"] = compat
-        
+
+        for section, keys in _OPT_SECTIONS:
+            obj = getattr(server, section)
+            if not obj:
+                continue
+            section_dict = {key: value for key in keys if (value := getattr(obj, key))}
+            if section == "requirements" and obj.network is not None:
+                section_dict["network"] = obj.network
+            if section_dict:
+                result[section] = section_dict
+
         return result
\ No newline at end of file
@@ -1,12 +1,29 @@
 """Registry schema validation and structure definitions."""
 
+import hashlib
 import json
-from dataclasses import dataclass
+import sys
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 import yaml  # type: ignore[import-untyped]
 
+# Prefer the libyaml C loader/dumper when PyYAML was built with it;
+# semantics are identical but parsing is several times faster.
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader  # type: ignore[attr-defined]
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader  # type: ignore[assignment]
+    print("Warning: libyaml not available, using pure-Python YAML parser", file=sys.stderr)
+
+# orjson parses JSON in C and is several times faster than the stdlib
+# decoder; it stays an optional dependency
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 class DeploymentType(Enum):
     LOCAL = "local"
@@ -21,7 +38,30 @@ class TransportType(Enum):
     WEBSOCKET = "websocket"
 
 
-@dataclass
+# Value-to-member lookup tables; a dict hit is much cheaper than going
+# through Enum.__call__ and try/except ValueError in bulk parsing paths.
+_DEP_BY_VALUE = {d.value: d for d in DeploymentType}
+_TRANS_BY_VALUE = {t.value: t for t in TransportType}
+
+# Required config fields per transport, with the error message to emit
+# when one is missing. Adding a transport means adding a row here rather
+# than another validation branch.
+_TRANSPORT_REQUIRED = {
+    "stdio": (("command", "Command is required for stdio transport"),),
+    "http": (("url", "URL is required for HTTP transport"),),
+    "https": (("url", "URL is required for HTTP transport"),),
+}
+
+
+def _intern_all(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Intern every string in a list; values like "linux" or "read_file"
+    repeat across most servers, so interning collapses the duplicates."""
+    if not values:
+        return values
+    return [sys.intern(v) for v in values]
+
+
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     transport: TransportType
     command: Optional[str] = None
@@ -33,14 +73,14 @@ class ServerConfig:
     timeout: Optional[int] = 30
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Capabilities:
     tools: Optional[List[str]] = None
     resources: Optional[List[str]] = None
     prompts: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Requirements:
     platforms: Optional[List[str]] = None
     runtimes: Optional[Dict[str, str]] = None
@@ -48,20 +88,20 @@ class Requirements:
     network: Optional[bool] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Security:
     requires_auth: bool = False
     permissions: Optional[List[str]] = None
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Compatibility:
     claude_desktop: Optional[str] = None
     mcpconf: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServerEntry:
     name: str
     description: str
@@ -74,6 +114,23 @@ class ServerEntry:
     requirements: Optional[Requirements] = None
     security: Optional[Security] = None
     compatibility: Optional[Compatibility] = None
+    # Memoized content_hash slot; excluded from comparison and repr
+    _content_hash: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    @property
+    def content_hash(self) -> bytes:
+        """Stable digest of this entry's content, used as a conversion cache key.
+
+        Computed once per instance and memoized; entries are frozen, so the
+        digest stays valid for the instance's lifetime.
+        """
+        if self._content_hash is None:
+            data = asdict(self)
+            data.pop("_content_hash", None)
+            payload = json.dumps(data, sort_keys=True, default=str).encode()
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            object.__setattr__(self, "_content_hash", digest)
+        return self._content_hash
 
 
 @dataclass
@@ -83,6 +140,102 @@ class Registry:
     categories: Optional[Dict[str, List[str]]] = None
 
 
+def _rebuild_lazy_servers(hydrated: Dict[str, "ServerEntry"],
+                          raw: Dict[str, Dict[str, Any]]) -> "_LazyServers":
+    """Pickle reconstructor for _LazyServers; keeps raw entries unparsed."""
+    servers = _LazyServers(raw)
+    dict.update(servers, hydrated)
+    return servers
+
+
+class _LazyServers(dict):
+    """Mapping of server_id -> ServerEntry that parses entries on demand.
+
+    Raw entry dicts (already validated) stay unparsed until first access,
+    so loading a registry to read one server never constructs the others.
+    Once hydrated, an entry lives in the dict itself and the raw copy is
+    dropped. Iteration yields hydrated ids first, then pending ones;
+    callers that need a stable order sort, as elsewhere in this package.
+    """
+
+    def __init__(self, raw: Dict[str, Dict[str, Any]]):
+        super().__init__()
+        self._raw = raw
+
+    def __missing__(self, server_id: str) -> ServerEntry:
+        entry = RegistrySchema.parse_server_entry(self._raw.pop(server_id))
+        self[server_id] = entry
+        return entry
+
+    def __setitem__(self, server_id: str, entry: ServerEntry) -> None:
+        self._raw.pop(server_id, None)
+        dict.__setitem__(self, server_id, entry)
+
+    def __delitem__(self, server_id: str) -> None:
+        if dict.__contains__(self, server_id):
+            dict.__delitem__(self, server_id)
+        else:
+            del self._raw[server_id]
+
+    def __contains__(self, server_id: object) -> bool:
+        return dict.__contains__(self, server_id) or server_id in self._raw
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._raw)
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        yield from self._raw
+
+    def __reduce__(self):
+        # Preserve laziness across pickling (the registry load cache)
+        return _rebuild_lazy_servers, (dict(dict.items(self)), dict(self._raw))
+
+    # dict's C-level mutators (update, pop, setdefault, clear) bypass
+    # __setitem__/__delitem__, which would leave stale copies in _raw;
+    # reroute them through the overrides.
+
+    def update(self, *args, **kwargs) -> None:
+        for server_id, entry in dict(*args, **kwargs).items():
+            self[server_id] = entry
+
+    def pop(self, server_id: str, *default: Any) -> Any:
+        if dict.__contains__(self, server_id):
+            return dict.pop(self, server_id)
+        if server_id in self._raw:
+            return RegistrySchema.parse_server_entry(self._raw.pop(server_id))
+        if default:
+            return default[0]
+        raise KeyError(server_id)
+
+    def setdefault(self, server_id: str, default: Any = None) -> Any:
+        if server_id in self:
+            return self[server_id]
+        self[server_id] = default
+        return default
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._raw.clear()
+
+    def get(self, server_id: str, default: Any = None) -> Any:
+        try:
+            return self[server_id]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        for server_id in list(self):
+            yield self[server_id]
+
+    def items(self):
+        for server_id in list(self):
+            yield server_id, self[server_id]
+
+
 class RegistrySchema:
     """Schema validation and parsing for MCP server registry."""
     
@@ -100,36 +253,46 @@ class RegistrySchema:
         
         # Validate deployment type
         if "deployment" in data:
-            try:
-                DeploymentType(data["deployment"])
-            except ValueError:
+            if data["deployment"] not in _DEP_BY_VALUE:
                 errors["deployment"] = f"Invalid deployment type: {data['deployment']}"
         
         # Validate transport type in config
         if "config" in data and isinstance(data["config"], dict):
             if "transport" not in data["config"]:
                 errors["config.transport"] = "Transport type is required in config"
-            else:
-                try:
-                    TransportType(data["config"]["transport"])
-                except ValueError:
-                    errors["config.transport"] = f"Invalid transport type: {data['config']['transport']}"
+            elif data["config"]["transport"] not in _TRANS_BY_VALUE:
+                errors["config.transport"] = f"Invalid transport type: {data['config']['transport']}"
             
             # Validate transport-specific requirements
             transport = data["config"].get("transport")
-            if transport == "stdio" and "command" not in data["config"]:
-                errors["config.command"] = "Command is required for stdio transport"
-            elif transport in ["http", "https"] and "url" not in data["config"]:
-                errors["config.url"] = "URL is required for HTTP transport"
+            for required, message in _TRANSPORT_REQUIRED.get(transport, ()):
+                if required not in data["config"]:
+                    errors[f"config.{required}"] = message
         
         return errors
-    
+
+    @classmethod
+    def validate_entry(cls, entry: ServerEntry) -> Dict[str, str]:
+        """Validate an already-parsed ServerEntry without a dict round trip.
+
+        Required fields and enum types are guaranteed by construction, so
+        only the transport-specific rules need checking here.
+        """
+        errors: Dict[str, str] = {}
+        config = entry.config
+
+        for required, message in _TRANSPORT_REQUIRED.get(config.transport.value, ()):
+            if not getattr(config, required):
+                errors[f"config.{required}"] = message
+
+        return errors
+
     @classmethod
     def parse_server_entry(cls, data: Dict[str, Any]) -> ServerEntry:
         """Parse validated data into ServerEntry object."""
         config_data = data["config"]
         config = ServerConfig(
-            transport=TransportType(config_data["transport"]),
+            transport=_TRANS_BY_VALUE[config_data["transport"]],
             command=config_data.get("command"),
             args=config_data.get("args"),
             url=config_data.get("url"),
@@ -151,9 +314,10 @@ class RegistrySchema:
         requirements = None
         if "requirements" in data:
             req_data = data["requirements"]
+            runtimes = req_data.get("runtimes")
             requirements = Requirements(
-                platforms=req_data.get("platforms"),
-                runtimes=req_data.get("runtimes"),
+                platforms=_intern_all(req_data.get("platforms")),
+                runtimes={sys.intern(k): v for k, v in runtimes.items()} if runtimes else runtimes,
                 dependencies=req_data.get("dependencies"),
                 network=req_data.get("network")
             )
@@ -163,7 +327,7 @@ class RegistrySchema:
             sec_data = data["security"]
             security = Security(
                 requires_auth=sec_data.get("requires_auth", False),
-                permissions=sec_data.get("permissions"),
+                permissions=_intern_all(sec_data.get("permissions")),
                 sandbox=sec_data.get("sandbox", False)
             )
         
@@ -179,9 +343,9 @@ class RegistrySchema:
             name=data["name"],
             description=data["description"],
             version=data["version"],
-            deployment=DeploymentType(data["deployment"]),
+            deployment=_DEP_BY_VALUE[data["deployment"]],
             config=config,
-            license=data.get("license"),
+            license=sys.intern(data["license"]) if data.get("license") else data.get("license"),
             source_url=data.get("source_url"),
             capabilities=capabilities,
             requirements=requirements,
@@ -190,41 +354,82 @@ class RegistrySchema:
         )
     
     @classmethod
-    def parse_registry(cls, data: Dict[str, Any]) -> Registry:
-        """Parse registry data and validate all server entries."""
+    def parse_many(cls, entries):
+        """Validate and parse (server_id, data) pairs in a single pass.
+
+        Yields (server_id, entry, errors) tuples; entry is None whenever
+        validation produced errors. Lets bulk callers avoid a separate
+        validation loop and per-entry error handling.
+        """
+        for server_id, server_data in entries:
+            errors = cls.validate_server_entry(server_data)
+            entry = None if errors else cls.parse_server_entry(server_data)
+            yield server_id, entry, errors
+
+    @classmethod
+    def parse_registry(cls, data: Dict[str, Any], consume: bool = False,
+                       lazy: bool = False) -> Registry:
+        """Parse registry data and validate all server entries.
+
+        With consume=True the raw per-server dicts are popped from data as
+        they are parsed, so each one becomes collectable once its
+        ServerEntry exists. load_from_file uses this to keep peak memory
+        close to one representation of the registry instead of two;
+        callers that still need data afterwards must leave consume off.
+
+        With lazy=True entries are still validated up front (so bad data
+        fails the load as before) but ServerEntry construction is deferred
+        to first access via _LazyServers.
+        """
         if "version" not in data:
             raise ValueError("Registry version is required")
-        
+
         if "servers" not in data:
             raise ValueError("Servers section is required")
-        
-        servers = {}
-        for server_id, server_data in data["servers"].items():
+
+        raw_servers = data["servers"]
+        for server_id, server_data in raw_servers.items():
             errors = cls.validate_server_entry(server_data)
             if errors:
                 error_msg = f"Validation errors for server '{server_id}': "
                 error_msg += ", ".join([f"{k}: {v}" for k, v in errors.items()])
                 raise ValueError(error_msg)
-            
-            servers[server_id] = cls.parse_server_entry(server_data)
-        
+
+        servers: Dict[str, ServerEntry]
+        if lazy:
+            servers = _LazyServers(raw_servers if consume else dict(raw_servers))
+        else:
+            server_ids = list(raw_servers) if consume else raw_servers
+            servers = {}
+            for server_id in server_ids:
+                server_data = raw_servers.pop(server_id) if consume else raw_servers[server_id]
+                servers[server_id] = cls.parse_server_entry(server_data)
+
         return Registry(
             version=data["version"],
             servers=servers,
             categories=data.get("categories")
         )
-    
+
     @classmethod
     def load_from_file(cls, file_path: str) -> Registry:
         """Load registry from YAML or JSON file."""
-        with open(file_path, 'r') as f:
-            if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
-        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        if file_path.endswith('.yaml') or file_path.endswith('.yml'):
+            data = yaml.load(raw, Loader=YamlLoader)
+        elif orjson is not None:
+            data = orjson.loads(raw) if raw else None
+        else:
+            data = json.loads(raw) if raw else None
+
+        # Drop the raw bytes before building the dataclass tree so large
+        # files never hold three representations at once
+        del raw
+
         # Handle empty files
         if data is None:
             data = {"version": "1.0", "servers": {}}
-        
-        return cls.parse_registry(data)
\ No newline at end of file
+
+        return cls.parse_registry(data, consume=True, lazy=True)
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""Shared pytest configuration for the mcpconf test suite.
+
+Importing these here pays the PyYAML (C bindings when present) and CLI
+module import cost once at collection time, instead of attributing it to
+whichever test happens to run first — which also keeps timings uniform
+across pytest-xdist workers.
+"""
+
+import json  # noqa: F401
+
+import yaml  # noqa: F401
+
+import mcpconf.cli  # noqa: F401
+from mcpconf.schema import YamlDumper, YamlLoader  # noqa: F401
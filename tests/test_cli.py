@@ -1,248 +1,237 @@
 """Tests for CLI functionality."""
 
 import json
-import tempfile
-from io import StringIO
-from pathlib import Path
-from unittest.mock import patch
+import re
 
 import pytest
 import yaml
 
 from mcpconf.cli import main
+from mcpconf.registry import MCPServerRegistry
+from mcpconf.schema import RegistrySchema, YamlLoader
 
+# Sample registry content shared by the file-backed and in-memory fixtures
+REGISTRY_DATA = {
+    "version": "1.0",
+    "servers": {
+        "test-server": {
+            "name": "Test Server",
+            "description": "Test description",
+            "version": "1.0.0",
+            "deployment": "local",
+            "config": {
+                "transport": "stdio",
+                "command": "python",
+                "args": ["server.py"]
+            }
+        },
+        "remote-server": {
+            "name": "Remote Server",
+            "description": "Remote test server",
+            "version": "2.0.0",
+            "deployment": "remote",
+            "config": {
+                "transport": "https",
+                "url": "https://api.example.com/mcp"
+            }
+        }
+    }
+}
 
-class TestCLI:
-    """Test CLI command functionality."""
-    
-    @pytest.fixture
-    def sample_registry_file(self):
-        """Create a temporary registry file for testing."""
-        registry_data = {
-            "version": "1.0",
-            "servers": {
-                "test-server": {
-                    "name": "Test Server",
-                    "description": "Test description",
-                    "version": "1.0.0",
-                    "deployment": "local",
-                    "config": {
-                        "transport": "stdio",
-                        "command": "python",
-                        "args": ["server.py"]
-                    }
-                },
-                "remote-server": {
-                    "name": "Remote Server",
-                    "description": "Remote test server",
-                    "version": "2.0.0",
-                    "deployment": "remote",
-                    "config": {
-                        "transport": "https",
-                        "url": "https://api.example.com/mcp"
-                    }
-                }
+
+# Expected convert outputs for the sample servers, built once
+CLAUDE_EXPECTED = {"mcpServers": {"test-server": {"command": "python", "args": ["server.py"]}}}
+GITHUB_EXPECTED = {"servers": {"remote-server": {"type": "http", "url": "https://api.example.com/mcp"}}}
+
+# Help output marker, matched in one pass instead of two substring scans
+_HELP_RE = re.compile(r"usage:|Available commands:")
+
+
+def assert_all_in(output, tokens):
+    """Assert every token appears in output, reporting all misses at once."""
+    missing = [tok for tok in tokens if tok not in output]
+    assert not missing, f"Tokens not found in output: {missing}"
+
+
+@pytest.fixture(scope="session")
+def sample_registry_file(tmp_path_factory):
+    """Create a registry file shared by the whole session.
+
+    The CLI tests only read from it, so one write covers every test;
+    pytest cleans the directory (and any load-cache sidecar) up for us.
+    The content is written as JSON — YAML 1.2 is a superset of JSON, so
+    the registry's YAML loader parses it unchanged, and json.dumps is far
+    cheaper than yaml.dump for this trivially nested data.
+    """
+    path = tmp_path_factory.mktemp("registry") / "mcp-registry.yaml"
+    path.write_text(json.dumps(REGISTRY_DATA))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def claude_config_file(tmp_path_factory):
+    """Claude Desktop config shared by the import tests, which only read it."""
+    path = tmp_path_factory.mktemp("claude") / "claude_desktop_config.json"
+    path.write_text(json.dumps({
+        "mcpServers": {
+            "weather": {
+                "command": "python",
+                "args": ["weather.py"]
             }
         }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(registry_data, f)
-            f.flush()
-            yield f.name
-            Path(f.name).unlink()  # Clean up
-    
-    def test_list_command(self, sample_registry_file):
+    }))
+    return str(path)
+
+
+@pytest.fixture
+def in_memory_registry(monkeypatch):
+    """Serve the sample registry straight from memory.
+
+    Bypasses the file read and YAML parse the CLI's get_registry would
+    do, for tests that aren't about file loading. Returns a dummy path to
+    pass as --registry.
+    """
+    registry = MCPServerRegistry()
+    registry.registry = RegistrySchema.parse_registry(REGISTRY_DATA)
+    monkeypatch.setattr("mcpconf.cli.get_registry", lambda args: registry)
+    return "in-memory.yaml"
+
+
+class TestCLI:
+    """Test CLI command functionality."""
+
+    def test_list_command(self, sample_registry_file, capsys):
         """Test list command."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'list']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "test-server" in output
-                assert "remote-server" in output
-                assert "NAME" in output  # Header
-    
-    def test_list_command_deployment_filter(self, sample_registry_file):
+        main(['--registry', sample_registry_file, 'list'])
+        output = capsys.readouterr().out
+        assert_all_in(output, ["test-server", "remote-server", "NAME"])
+
+    def test_list_command_deployment_filter(self, in_memory_registry, capsys):
         """Test list command with deployment filter."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'list', '--deployment', 'local']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "test-server" in output
-                assert "remote-server" not in output
-    
-    def test_list_command_detailed(self, sample_registry_file):
+        main(['--registry', in_memory_registry, 'list', '--deployment', 'local'])
+        output = capsys.readouterr().out
+        assert "test-server" in output
+        assert "remote-server" not in output
+
+    def test_list_command_json(self, in_memory_registry, capsys):
+        """Test list command with JSON output."""
+        main(['--registry', in_memory_registry, 'list', '--json'])
+        rows = json.loads(capsys.readouterr().out)
+        assert {row["id"] for row in rows} == {"test-server", "remote-server"}
+        assert all({"id", "deployment", "transport", "description"} <= row.keys() for row in rows)
+
+    def test_list_command_detailed(self, in_memory_registry, capsys):
         """Test list command with detailed output."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'list', '--detailed']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "Server: test-server" in output
-                assert "Name: Test Server" in output
-                assert "Transport: stdio" in output
-    
-    def test_show_command(self, sample_registry_file):
+        main(['--registry', in_memory_registry, 'list', '--detailed'])
+        output = capsys.readouterr().out
+        assert_all_in(output, ["Server: test-server", "Name: Test Server", "Transport: stdio"])
+
+    def test_show_command(self, in_memory_registry, capsys):
         """Test show command."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'show', 'test-server']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "Server: test-server" in output
-                assert "Name: Test Server" in output
-                assert "Description: Test description" in output
-                assert "Configuration:" in output
-                assert "Command: python" in output
-    
-    def test_show_command_not_found(self, sample_registry_file):
+        main(['--registry', in_memory_registry, 'show', 'test-server'])
+        output = capsys.readouterr().out
+        assert_all_in(output, [
+            "Server: test-server",
+            "Name: Test Server",
+            "Description: Test description",
+            "Configuration:",
+            "Command: python",
+        ])
+
+    def test_show_command_not_found(self, in_memory_registry, capsys):
         """Test show command for non-existent server."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'show', 'nonexistent']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                with pytest.raises(SystemExit):
-                    main()
-                output = fake_out.getvalue()
-                assert "not found" in output
-    
-    def test_search_command(self, sample_registry_file):
+        with pytest.raises(SystemExit):
+            main(['--registry', in_memory_registry, 'show', 'nonexistent'])
+        output = capsys.readouterr().out
+        assert output.rstrip().endswith("not found.")
+
+    def test_search_command(self, in_memory_registry, capsys):
         """Test search command."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'search', 'Remote']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "Found 1 servers" in output
-                assert "remote-server" in output
-                assert "test-server" not in output
-    
-    def test_search_command_no_results(self, sample_registry_file):
+        main(['--registry', in_memory_registry, 'search', 'Remote'])
+        output = capsys.readouterr().out
+        assert output.startswith("Found 1 servers")
+        assert "remote-server" in output
+        assert "test-server" not in output
+
+    def test_search_command_no_results(self, in_memory_registry, capsys):
         """Test search command with no results."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'search', 'nonexistent']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "No servers found matching" in output
-    
-    def test_convert_command_claude(self, sample_registry_file):
-        """Test convert command to Claude Desktop format."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'convert', 'test-server', 'claude']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                config = json.loads(output)
-                assert "mcpServers" in config
-                assert "test-server" in config["mcpServers"]
-                assert config["mcpServers"]["test-server"]["command"] == "python"
-    
-    def test_convert_command_with_output_file(self, sample_registry_file):
+        main(['--registry', in_memory_registry, 'search', 'nonexistent'])
+        output = capsys.readouterr().out
+        assert output.startswith("No servers found matching")
+
+    @pytest.mark.parametrize("server_id,fmt,expected", [
+        ("test-server", "claude", CLAUDE_EXPECTED),
+        ("remote-server", "github", GITHUB_EXPECTED),
+        ("test-server", "hosts", "test-server local stdio"),
+    ])
+    def test_convert_command(self, in_memory_registry, capsys, server_id, fmt, expected):
+        """Test convert command across target formats."""
+        main(['--registry', in_memory_registry, 'convert', server_id, fmt])
+        output = capsys.readouterr().out
+        if isinstance(expected, dict):
+            assert json.loads(output) == expected
+        else:
+            assert output.startswith(expected)
+
+    def test_convert_command_with_output_file(self, in_memory_registry, tmp_path, capsys):
         """Test convert command with output file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as output_file:
-            with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'convert', 'test-server', 'claude', '--output', output_file.name]):
-                with patch('sys.stdout', new=StringIO()) as fake_out:
-                    main()
-                    output = fake_out.getvalue()
-                    assert f"Configuration written to {output_file.name}" in output
-                
-                # Verify output file contents
-                with open(output_file.name, 'r') as f:
-                    config = json.load(f)
-                    assert "mcpServers" in config
-            
-            Path(output_file.name).unlink()  # Clean up
-    
-    def test_convert_command_hosts_format(self, sample_registry_file):
-        """Test convert command to hosts format."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'convert', 'test-server', 'hosts']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue().strip()
-                assert output.startswith("test-server local stdio")
-    
-    def test_validate_command_specific_server(self, sample_registry_file):
+        output_path = tmp_path / "claude.json"
+        main(['--registry', in_memory_registry, 'convert', 'test-server', 'claude', '--output', str(output_path)])
+        output = capsys.readouterr().out
+        assert f"Configuration written to {output_path}" in output
+
+        # Verify output file contents
+        assert json.loads(output_path.read_text()) == CLAUDE_EXPECTED
+
+    def test_validate_command_specific_server(self, in_memory_registry, capsys):
         """Test validate command for specific server."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'validate', 'test-server']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "is valid" in output
-    
-    def test_validate_command_all_servers(self, sample_registry_file):
+        main(['--registry', in_memory_registry, 'validate', 'test-server'])
+        output = capsys.readouterr().out
+        assert output.rstrip().endswith("is valid.")
+
+    def test_validate_command_all_servers(self, in_memory_registry, capsys):
         """Test validate command for all servers."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'validate']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "All servers are valid" in output
-    
-    def test_import_command(self):
+        main(['--registry', in_memory_registry, 'validate'])
+        output = capsys.readouterr().out
+        assert output.startswith("All servers are valid")
+
+    def test_import_command(self, claude_config_file, tmp_path, capsys):
         """Test import command."""
-        claude_config = {
-            "mcpServers": {
-                "weather": {
-                    "command": "python",
-                    "args": ["weather.py"]
-                }
-            }
-        }
-        
-        # Create temporary Claude config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as claude_file:
-            json.dump(claude_config, claude_file)
-            claude_file.flush()
-            
-            # Create temporary registry file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as registry_file:
-                with patch('sys.argv', ['mcpconf', '--registry', registry_file.name, 'import', claude_file.name]):
-                    with patch('sys.stdout', new=StringIO()) as fake_out:
-                        main()
-                        output = fake_out.getvalue()
-                        assert "Imported 1 servers" in output
-                        assert "not saved" in output
-            
-            Path(claude_file.name).unlink()  # Clean up
-            Path(registry_file.name).unlink()  # Clean up
-    
-    def test_import_command_with_save(self):
+        registry_path = tmp_path / "registry.yaml"
+        main(['--registry', str(registry_path), 'import', claude_config_file])
+        output = capsys.readouterr().out
+        assert "Imported 1 servers" in output
+        assert "not saved" in output
+
+    def test_import_command_with_save(self, claude_config_file, tmp_path, capsys):
         """Test import command with save option."""
-        claude_config = {
-            "mcpServers": {
-                "weather": {
-                    "command": "python",
-                    "args": ["weather.py"]
-                }
-            }
-        }
-        
-        # Create temporary Claude config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as claude_file:
-            json.dump(claude_config, claude_file)
-            claude_file.flush()
-            
-            # Create temporary registry file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as registry_file:
-                with patch('sys.argv', ['mcpconf', '--registry', registry_file.name, 'import', claude_file.name, '--save']):
-                    with patch('sys.stdout', new=StringIO()) as fake_out:
-                        main()
-                        output = fake_out.getvalue()
-                        assert "Imported 1 servers and saved" in output
-                
-                # Verify registry file was updated
-                with open(registry_file.name, 'r') as f:
-                    registry_data = yaml.safe_load(f)
-                    assert "weather" in registry_data["servers"]
-            
-            Path(claude_file.name).unlink()  # Clean up
-            Path(registry_file.name).unlink()  # Clean up
-    
-    def test_categories_command_empty(self, sample_registry_file):
+        registry_path = tmp_path / "registry.yaml"
+        main(['--registry', str(registry_path), 'import', claude_config_file, '--save'])
+        output = capsys.readouterr().out
+        assert "Imported 1 servers and saved" in output
+
+        # Verify registry file was updated
+        registry_data = yaml.load(registry_path.read_text(), Loader=YamlLoader)
+        assert "weather" in registry_data["servers"]
+
+    def test_import_command_empty_file(self, tmp_path, capsys):
+        """Test import command with an empty configuration file."""
+        config_path = tmp_path / "empty.json"
+        config_path.write_text("")
+        with pytest.raises(SystemExit):
+            main(['--registry', str(tmp_path / "registry.yaml"), 'import', str(config_path)])
+        output = capsys.readouterr().out
+        assert output.startswith("Invalid or empty configuration file")
+
+    def test_categories_command_empty(self, in_memory_registry, capsys):
         """Test categories command with no categories."""
-        with patch('sys.argv', ['mcpconf', '--registry', sample_registry_file, 'categories']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                main()
-                output = fake_out.getvalue()
-                assert "No categories defined" in output
-    
-    def test_no_command_shows_help(self):
+        main(['--registry', in_memory_registry, 'categories'])
+        output = capsys.readouterr().out
+        assert output.startswith("No categories defined")
+
+    def test_no_command_shows_help(self, capsys):
         """Test that running without command shows help."""
-        with patch('sys.argv', ['mcpconf']):
-            with patch('sys.stdout', new=StringIO()) as fake_out:
-                with pytest.raises(SystemExit):
-                    main()
-                output = fake_out.getvalue()
-                assert "usage:" in output or "Available commands:" in output
\ No newline at end of file
+        with pytest.raises(SystemExit):
+            main([])
+        output = capsys.readouterr().out
+        assert _HELP_RE.search(output)
@@ -12,25 +12,57 @@ from mcpconf.schema import (
 )
 
 
+# Entries shared across tests; ServerEntry is frozen, so building these
+# once at import time is safe and skips per-test construction.
+STDIO_SERVER = ServerEntry(
+    name="Test Server",
+    description="Test description",
+    version="1.0.0",
+    deployment=DeploymentType.LOCAL,
+    config=ServerConfig(
+        transport=TransportType.STDIO,
+        command="python",
+        args=["server.py"],
+        env={"API_KEY": "secret"}
+    )
+)
+
+HTTPS_SERVER = ServerEntry(
+    name="Test Server",
+    description="Test description",
+    version="1.0.0",
+    deployment=DeploymentType.REMOTE,
+    config=ServerConfig(
+        transport=TransportType.HTTPS,
+        url="https://api.example.com/mcp",
+        headers={"Authorization": "Bearer token"}
+    )
+)
+
+DXT_PYTHON_SERVER = ServerEntry(
+    name="Test Python Server",
+    description="Python-based server",
+    version="1.2.3",
+    deployment=DeploymentType.LOCAL,
+    config=ServerConfig(
+        transport=TransportType.STDIO,
+        command="python",
+        args=["server.py"],
+        env={"DEBUG": "true"}
+    ),
+    capabilities=Capabilities(
+        tools=["tool1", "tool2"]
+    ),
+    license="MIT"
+)
+
+
 class TestFormatConverter:
     """Test format conversion functionality."""
     
     def test_to_claude_desktop_stdio(self):
         """Test conversion to Claude Desktop format for stdio transport."""
-        server = ServerEntry(
-            name="Test Server",
-            description="Test description",
-            version="1.0.0",
-            deployment=DeploymentType.LOCAL,
-            config=ServerConfig(
-                transport=TransportType.STDIO,
-                command="python",
-                args=["server.py"],
-                env={"API_KEY": "secret"}
-            )
-        )
-        
-        result = FormatConverter.to_claude_desktop(server, "test-server")
+        result = FormatConverter.to_claude_desktop(STDIO_SERVER, "test-server")
         expected = {
             "mcpServers": {
                 "test-server": {
@@ -45,19 +77,7 @@ class TestFormatConverter:
     
     def test_to_claude_desktop_http(self):
         """Test conversion to Claude Desktop format for HTTP transport."""
-        server = ServerEntry(
-            name="Test Server",
-            description="Test description", 
-            version="1.0.0",
-            deployment=DeploymentType.REMOTE,
-            config=ServerConfig(
-                transport=TransportType.HTTPS,
-                url="https://api.example.com/mcp",
-                headers={"Authorization": "Bearer token"}
-            )
-        )
-        
-        result = FormatConverter.to_claude_desktop(server, "test-server")
+        result = FormatConverter.to_claude_desktop(HTTPS_SERVER, "test-server")
         expected = {
             "mcpServers": {
                 "test-server": {
@@ -69,6 +89,28 @@ class TestFormatConverter:
         
         assert result == expected
     
+    def test_to_claude_desktop_many(self):
+        """Test batch conversion of a whole server mapping in one call."""
+        servers = {
+            f"server-{i}": ServerEntry(
+                name=f"Server {i}",
+                description="Batch test server",
+                version="1.0.0",
+                deployment=DeploymentType.LOCAL,
+                config=ServerConfig(
+                    transport=TransportType.STDIO,
+                    command="python",
+                    args=[f"server_{i}.py"]
+                )
+            )
+            for i in range(100)
+        }
+
+        result = FormatConverter.to_claude_desktop_many(servers)
+        assert set(result["mcpServers"]) == set(servers)
+        single = FormatConverter.to_claude_desktop(servers["server-7"], "server-7")
+        assert result["mcpServers"]["server-7"] == single["mcpServers"]["server-7"]
+
     def test_to_github_mcp_success(self):
         """Test conversion to GitHub MCP format for HTTP transport.""" 
         server = ServerEntry(
@@ -114,24 +156,7 @@ class TestFormatConverter:
     
     def test_to_dxt_manifest_python(self):
         """Test conversion to DXT manifest format for Python server."""
-        server = ServerEntry(
-            name="Test Python Server",
-            description="Python-based server",
-            version="1.2.3",
-            deployment=DeploymentType.LOCAL,
-            config=ServerConfig(
-                transport=TransportType.STDIO,
-                command="python",
-                args=["server.py"],
-                env={"DEBUG": "true"}
-            ),
-            capabilities=Capabilities(
-                tools=["tool1", "tool2"]
-            ),
-            license="MIT"
-        )
-        
-        result = FormatConverter.to_dxt_manifest(server, "test-server")
+        result = FormatConverter.to_dxt_manifest(DXT_PYTHON_SERVER, "test-server")
         assert result["dxt_version"] == "1.0"
         assert result["name"] == "test-server"
         assert result["display_name"] == "Test Python Server"
@@ -180,38 +205,13 @@ class TestFormatConverter:
     
     def test_to_hosts_format_stdio(self):
         """Test conversion to hosts file format for stdio transport."""
-        server = ServerEntry(
-            name="Test Server",
-            description="Test description",
-            version="1.0.0",
-            deployment=DeploymentType.LOCAL,
-            config=ServerConfig(
-                transport=TransportType.STDIO,
-                command="python",
-                args=["server.py"],
-                env={"API_KEY": "secret"}
-            )
-        )
-        
-        result = FormatConverter.to_hosts_format(server, "test-server")
+        result = FormatConverter.to_hosts_format(STDIO_SERVER, "test-server")
         expected = "test-server local stdio python:server.py auth=key env=API_KEY"
         assert result == expected
     
     def test_to_hosts_format_http(self):
         """Test conversion to hosts file format for HTTP transport."""
-        server = ServerEntry(
-            name="Test Server",
-            description="Test description",
-            version="1.0.0",
-            deployment=DeploymentType.REMOTE,
-            config=ServerConfig(
-                transport=TransportType.HTTPS,
-                url="https://api.example.com/mcp",
-                headers={"Authorization": "Bearer token"}
-            )
-        )
-        
-        result = FormatConverter.to_hosts_format(server, "test-server")
+        result = FormatConverter.to_hosts_format(HTTPS_SERVER, "test-server")
         expected = "test-server remote https https://api.example.com/mcp auth=bearer"
         assert result == expected
     
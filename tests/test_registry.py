@@ -1,22 +1,83 @@
 """Tests for registry management functionality."""
 
+import copy
 import json
-import tempfile
-from pathlib import Path
+import os
 
 import pytest
 import yaml
 
 from mcpconf.registry import MCPServerRegistry
-from mcpconf.schema import DeploymentType, ServerConfig, ServerEntry, TransportType
+from mcpconf.schema import (
+    DeploymentType,
+    RegistrySchema,
+    ServerConfig,
+    ServerEntry,
+    TransportType,
+    YamlDumper,
+    YamlLoader,
+)
+
+
+# Sample registry content shared by the fixtures; serialized once at
+# import so fixture writers copy bytes instead of re-encoding per test
+SAMPLE_REGISTRY_DICT = {
+    "version": "1.0",
+    "servers": {
+        "test-server": {
+            "name": "Test Server",
+            "description": "Test description",
+            "version": "1.0.0",
+            "deployment": "local",
+            "config": {
+                "transport": "stdio",
+                "command": "python",
+                "args": ["server.py"]
+            }
+        },
+        "remote-server": {
+            "name": "Remote Server",
+            "description": "Remote test server",
+            "version": "2.0.0",
+            "deployment": "remote",
+            "config": {
+                "transport": "https",
+                "url": "https://api.example.com/mcp"
+            }
+        }
+    },
+    "categories": {
+        "test": ["test-server", "remote-server"]
+    }
+}
+
+_SAMPLE_JSON_BYTES = json.dumps(SAMPLE_REGISTRY_DICT).encode()
+_SAMPLE_YAML_TEXT = yaml.dump(SAMPLE_REGISTRY_DICT, Dumper=YamlDumper)
+
+
+def make_registry(data=None):
+    """Build a registry directly from a dict, skipping the filesystem.
+
+    For tests about registry logic rather than file loading, assigning a
+    parsed Registry is one schema pass instead of a dump + write + read
+    + parse round trip.
+    """
+    registry = MCPServerRegistry()
+    if data is not None:
+        registry.registry = RegistrySchema.parse_registry(data)
+    return registry
 
 
 class TestMCPServerRegistry:
     """Test registry management functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_server(self):
-        """Create a sample server entry for testing."""
+        """Create a sample server entry for testing.
+
+        ServerEntry is a frozen dataclass, so one instance can safely be
+        shared by every test in the session.
+        """
         return ServerEntry(
             name="Test Server",
             description="Test description",
@@ -29,39 +90,15 @@ class TestMCPServerRegistry:
             )
         )
     
-    @pytest.fixture
-    def sample_registry_data(self):
-        """Create sample registry data."""
-        return {
-            "version": "1.0",
-            "servers": {
-                "test-server": {
-                    "name": "Test Server",
-                    "description": "Test description",
-                    "version": "1.0.0",
-                    "deployment": "local",
-                    "config": {
-                        "transport": "stdio",
-                        "command": "python",
-                        "args": ["server.py"]
-                    }
-                },
-                "remote-server": {
-                    "name": "Remote Server",
-                    "description": "Remote test server",
-                    "version": "2.0.0",
-                    "deployment": "remote",
-                    "config": {
-                        "transport": "https",
-                        "url": "https://api.example.com/mcp"
-                    }
-                }
-            },
-            "categories": {
-                "test": ["test-server", "remote-server"]
-            }
-        }
-    
+    @pytest.fixture(scope="session")
+    def loaded_registry(self):
+        """Parse the sample registry once for tests that only read it.
+
+        Mutating tests build their own instance with make_registry
+        instead of sharing this one.
+        """
+        return make_registry(SAMPLE_REGISTRY_DICT)
+
     def test_init_empty_registry(self):
         """Test initializing empty registry."""
         registry = MCPServerRegistry()
@@ -76,61 +113,60 @@ class TestMCPServerRegistry:
         assert registry.registry.version == "1.0"
         assert len(registry.registry.servers) == 0
     
-    def test_load_registry_yaml(self, sample_registry_data):
+    def test_load_registry_yaml(self, tmp_path):
         """Test loading registry from YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            assert len(registry.registry.servers) == 2
-            assert "test-server" in registry.registry.servers
-            assert "remote-server" in registry.registry.servers
-            
-            Path(f.name).unlink()  # Clean up
+        path = tmp_path / "registry.yaml"
+        path.write_text(_SAMPLE_YAML_TEXT)
+        
+        registry = MCPServerRegistry(str(path))
+        assert len(registry.registry.servers) == 2
+        assert "test-server" in registry.registry.servers
+        assert "remote-server" in registry.registry.servers
     
-    def test_load_registry_json(self, sample_registry_data):
+    def test_load_registry_json(self, tmp_path):
         """Test loading registry from JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            assert len(registry.registry.servers) == 2
-            assert "test-server" in registry.registry.servers
-            
-            Path(f.name).unlink()  # Clean up
+        path = tmp_path / "registry.json"
+        path.write_bytes(_SAMPLE_JSON_BYTES)
+        
+        registry = MCPServerRegistry(str(path))
+        assert len(registry.registry.servers) == 2
+        assert "test-server" in registry.registry.servers
     
-    def test_save_registry_yaml(self, sample_server):
+    def test_save_registry_yaml(self, sample_server, tmp_path):
         """Test saving registry to YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            registry = MCPServerRegistry()
-            registry.add_server("test-server", sample_server)
-            registry.save_registry(f.name)
-            
-            # Verify file was created and contains expected data
-            with open(f.name, 'r') as read_f:
-                data = yaml.safe_load(read_f)
-                assert data["version"] == "1.0"
-                assert "test-server" in data["servers"]
-                assert data["servers"]["test-server"]["name"] == "Test Server"
-            
-            Path(f.name).unlink()  # Clean up
+        path = tmp_path / "registry.yaml"
+        registry = MCPServerRegistry()
+        registry.add_server("test-server", sample_server)
+        registry.save_registry(str(path))
+        
+        # Verify file was created and contains expected data
+        data = yaml.load(path.read_text(), Loader=YamlLoader)
+        assert data["version"] == "1.0"
+        assert "test-server" in data["servers"]
+        assert data["servers"]["test-server"]["name"] == "Test Server"
     
-    def test_save_registry_json(self, sample_server):
+    def test_save_registry_json(self, sample_server, tmp_path):
         """Test saving registry to JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            registry = MCPServerRegistry()
-            registry.add_server("test-server", sample_server)
-            registry.save_registry(f.name)
-            
-            # Verify file was created and contains expected data
-            with open(f.name, 'r') as read_f:
-                data = json.load(read_f)
-                assert data["version"] == "1.0"
-                assert "test-server" in data["servers"]
-            
-            Path(f.name).unlink()  # Clean up
+        path = tmp_path / "registry.json"
+        registry = MCPServerRegistry()
+        registry.add_server("test-server", sample_server)
+        registry.save_registry(str(path))
+        
+        # Verify file was created and contains expected data
+        data = json.loads(path.read_bytes())
+        assert data["version"] == "1.0"
+        assert "test-server" in data["servers"]
+    
+    def test_save_registry_preserves_mode(self, sample_server, tmp_path):
+        """Test that saving over an existing registry keeps its permissions."""
+        path = tmp_path / "registry.yaml"
+        registry = MCPServerRegistry()
+        registry.add_server("test-server", sample_server)
+        registry.save_registry(str(path))
+        os.chmod(path, 0o644)
+        
+        registry.save_registry(str(path))
+        assert path.stat().st_mode & 0o777 == 0o644
     
     def test_add_server(self, sample_server):
         """Test adding server to registry."""
@@ -171,82 +207,55 @@ class TestMCPServerRegistry:
         server = registry.get_server("nonexistent")
         assert server is None
     
-    def test_list_servers_all(self, sample_registry_data):
+    def test_list_servers_all(self, loaded_registry):
         """Test listing all servers."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            servers = registry.list_servers()
-            assert sorted(servers) == ["remote-server", "test-server"]
-            
-            Path(f.name).unlink()  # Clean up
+        servers = loaded_registry.list_servers()
+        assert set(servers) == {"remote-server", "test-server"}
     
-    def test_list_servers_by_deployment(self, sample_registry_data):
+    def test_list_servers_returns_fresh_list(self, loaded_registry):
+        """Test that mutating a returned listing does not poison the cache."""
+        loaded_registry.list_servers().append("bogus")
+        assert "bogus" not in loaded_registry.list_servers()
+    
+    def test_list_servers_by_deployment(self, loaded_registry):
         """Test listing servers filtered by deployment type."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            local_servers = registry.list_servers(deployment="local")
-            assert local_servers == ["test-server"]
-            
-            remote_servers = registry.list_servers(deployment="remote")
-            assert remote_servers == ["remote-server"]
-            
-            Path(f.name).unlink()  # Clean up
+        local_servers = loaded_registry.list_servers(deployment="local")
+        assert local_servers == ["test-server"]
+        
+        remote_servers = loaded_registry.list_servers(deployment="remote")
+        assert remote_servers == ["remote-server"]
     
-    def test_list_servers_by_category(self, sample_registry_data):
+    def test_list_servers_by_category(self, loaded_registry):
         """Test listing servers filtered by category."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            test_servers = registry.list_servers(category="test")
-            assert sorted(test_servers) == ["remote-server", "test-server"]
-            
-            Path(f.name).unlink()  # Clean up
+        test_servers = loaded_registry.list_servers(category="test")
+        assert set(test_servers) == {"remote-server", "test-server"}
     
-    def test_search_servers(self, sample_registry_data):
+    def test_search_servers(self, loaded_registry):
         """Test searching servers."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            
-            # Search by name
-            results = registry.search_servers("Remote")
-            assert results == ["remote-server"]
-            
-            # Search by description
-            results = registry.search_servers("Test description")
-            assert results == ["test-server"]
-            
-            # Search by ID
-            results = registry.search_servers("test-server")
-            assert results == ["test-server"]
-            
-            # No matches
-            results = registry.search_servers("nonexistent")
-            assert results == []
-            
-            Path(f.name).unlink()  # Clean up
+        # Search by name
+        results = loaded_registry.search_servers("Remote")
+        assert results == ["remote-server"]
+        
+        # Search by description
+        results = loaded_registry.search_servers("Test description")
+        assert results == ["test-server"]
+        
+        # Search by ID
+        results = loaded_registry.search_servers("test-server")
+        assert results == ["test-server"]
+        
+        # Infix match that is not token-aligned
+        results = loaded_registry.search_servers("emote")
+        assert results == ["remote-server"]
+        
+        # No matches
+        results = loaded_registry.search_servers("nonexistent")
+        assert results == []
     
-    def test_get_categories(self, sample_registry_data):
+    def test_get_categories(self, loaded_registry):
         """Test getting categories."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            categories = registry.get_categories()
-            assert categories == {"test": ["test-server", "remote-server"]}
-            
-            Path(f.name).unlink()  # Clean up
+        categories = loaded_registry.get_categories()
+        assert categories == {"test": ["test-server", "remote-server"]}
     
     def test_add_to_category(self, sample_server):
         """Test adding server to category."""
@@ -257,20 +266,16 @@ class TestMCPServerRegistry:
         categories = registry.get_categories()
         assert categories == {"new-category": ["test-server"]}
     
-    def test_remove_from_category(self, sample_registry_data):
+    def test_remove_from_category(self):
         """Test removing server from category."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_registry_data, f)
-            f.flush()
-            
-            registry = MCPServerRegistry(f.name)
-            result = registry.remove_from_category("test", "test-server")
-            assert result is True
-            
-            categories = registry.get_categories()
-            assert categories == {"test": ["remote-server"]}
-            
-            Path(f.name).unlink()  # Clean up
+        # parse_registry keeps a reference to the input's categories
+        # mapping, so give the mutating test its own copy
+        registry = make_registry(copy.deepcopy(SAMPLE_REGISTRY_DICT))
+        result = registry.remove_from_category("test", "test-server")
+        assert result is True
+        
+        categories = registry.get_categories()
+        assert categories == {"test": ["remote-server"]}
     
     def test_import_claude_desktop(self):
         """Test importing from Claude Desktop configuration."""
@@ -295,6 +300,23 @@ class TestMCPServerRegistry:
         assert "weather" in registry.registry.servers
         assert "sentry" in registry.registry.servers
     
+    def test_import_claude_desktop_overwrites_lazy_entry(self, tmp_path):
+        """Test importing an id that already exists unhydrated in a lazy registry."""
+        path = tmp_path / "registry.json"
+        path.write_bytes(_SAMPLE_JSON_BYTES)
+        registry = MCPServerRegistry(str(path))
+
+        count = registry.import_claude_desktop({
+            "mcpServers": {
+                "test-server": {"command": "python", "args": ["new.py"]}
+            }
+        })
+
+        assert count == 1
+        assert len(registry.registry.servers) == 2
+        assert registry.list_servers() == ["remote-server", "test-server"]
+        assert registry.get_server("test-server").config.args == ["new.py"]
+
     def test_validate_server_valid(self, sample_server):
         """Test validating valid server."""
         registry = MCPServerRegistry()
@@ -1,5 +1,7 @@
 """Tests for schema validation and parsing."""
 
+from dataclasses import asdict
+
 import pytest
 
 from mcpconf.schema import (
@@ -14,25 +16,106 @@ from mcpconf.schema import (
     TransportType,
 )
 
+# Valid baseline entry shared across validation and parsing tests;
+# error cases patch individual fields instead of re-declaring the dict
+BASE_ENTRY = {
+    "name": "Test Server",
+    "description": "Test description",
+    "version": "1.0.0",
+    "deployment": "local",
+    "config": {
+        "transport": "stdio",
+        "command": "python",
+        "args": ["server.py"]
+    }
+}
+
+
+# Entry exercising every optional field, and the parsed shape of each
+# optional section as asdict renders it
+FULL_ENTRY_DATA = {
+    "name": "Full Server",
+    "description": "Full description",
+    "version": "2.1.0",
+    "license": "MIT",
+    "source_url": "https://github.com/example/server",
+    "deployment": "local",
+    "config": {
+        "transport": "stdio",
+        "command": "python",
+        "args": ["server.py"],
+        "env": {"KEY": "value"},
+        "working_dir": "/path",
+        "timeout": 60
+    },
+    "capabilities": {
+        "tools": ["tool1", "tool2"],
+        "resources": ["res1", "res2"],
+        "prompts": ["prompt1"]
+    },
+    "requirements": {
+        "platforms": ["linux", "darwin"],
+        "runtimes": {"python": ">=3.8"},
+        "dependencies": ["requests"],
+        "network": True
+    },
+    "security": {
+        "requires_auth": True,
+        "permissions": ["fs.read"],
+        "sandbox": True
+    },
+    "compatibility": {
+        "claude_desktop": ">=0.10.0",
+        "mcpconf": ">=1.0.0"
+    }
+}
+
+EXPECTED_FULL = {
+    "config": {
+        "transport": TransportType.STDIO,
+        "command": "python",
+        "args": ["server.py"],
+        "env": {"KEY": "value"},
+        "url": None,
+        "headers": None,
+        "working_dir": "/path",
+        "timeout": 60
+    },
+    "capabilities": {
+        "tools": ["tool1", "tool2"],
+        "resources": ["res1", "res2"],
+        "prompts": ["prompt1"]
+    },
+    "requirements": {
+        "platforms": ["linux", "darwin"],
+        "runtimes": {"python": ">=3.8"},
+        "dependencies": ["requests"],
+        "network": True
+    },
+    "security": {
+        "requires_auth": True,
+        "permissions": ["fs.read"],
+        "sandbox": True
+    },
+    "compatibility": {
+        "claude_desktop": ">=0.10.0",
+        "mcpconf": ">=1.0.0"
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def full_server():
+    """Parse the full entry once for the assertions on it."""
+    return RegistrySchema.parse_server_entry(FULL_ENTRY_DATA)
+
 
 class TestRegistrySchema:
     """Test schema validation and parsing functionality."""
     
     def test_validate_server_entry_valid(self):
         """Test validation of valid server entry."""
-        data = {
-            "name": "Test Server",
-            "description": "Test description",
-            "version": "1.0.0",
-            "deployment": "local",
-            "config": {
-                "transport": "stdio",
-                "command": "python",
-                "args": ["server.py"]
-            }
-        }
-        
-        errors = RegistrySchema.validate_server_entry(data)
+        errors = RegistrySchema.validate_server_entry(BASE_ENTRY)
         assert errors == {}
     
     def test_validate_server_entry_missing_required(self):
@@ -48,73 +131,29 @@ class TestRegistrySchema:
         assert "deployment" in errors
         assert "config" in errors
     
-    def test_validate_server_entry_invalid_deployment(self):
-        """Test validation with invalid deployment type."""
-        data = {
-            "name": "Test Server",
-            "description": "Test description", 
-            "version": "1.0.0",
-            "deployment": "invalid",
-            "config": {"transport": "stdio", "command": "python"}
-        }
-        
-        errors = RegistrySchema.validate_server_entry(data)
-        assert "deployment" in errors
-    
-    def test_validate_server_entry_invalid_transport(self):
-        """Test validation with invalid transport type."""
-        data = {
-            "name": "Test Server",
-            "description": "Test description",
-            "version": "1.0.0", 
-            "deployment": "local",
-            "config": {"transport": "invalid"}
-        }
-        
-        errors = RegistrySchema.validate_server_entry(data)
-        assert "config.transport" in errors
-    
-    def test_validate_server_entry_stdio_missing_command(self):
-        """Test validation for stdio transport without command."""
-        data = {
-            "name": "Test Server",
-            "description": "Test description",
-            "version": "1.0.0",
-            "deployment": "local", 
-            "config": {"transport": "stdio"}
-        }
-        
-        errors = RegistrySchema.validate_server_entry(data)
-        assert "config.command" in errors
+    @pytest.mark.parametrize("patch, error_key", [
+        ({"deployment": "invalid"}, "deployment"),
+        ({"config": {"transport": "invalid"}}, "config.transport"),
+    ])
+    def test_validate_server_entry_invalid_value(self, patch, error_key):
+        """Test validation with an invalid enum value."""
+        errors = RegistrySchema.validate_server_entry({**BASE_ENTRY, **patch})
+        assert error_key in errors
     
-    def test_validate_server_entry_http_missing_url(self):
-        """Test validation for HTTP transport without URL."""
-        data = {
-            "name": "Test Server",
-            "description": "Test description",
-            "version": "1.0.0",
-            "deployment": "remote",
-            "config": {"transport": "http"}
-        }
-        
+    @pytest.mark.parametrize("transport, missing_field", [
+        ("stdio", "config.command"),
+        ("http", "config.url"),
+        ("https", "config.url"),
+    ])
+    def test_validate_server_entry_transport_required(self, transport, missing_field):
+        """Test validation of transport-specific required fields."""
+        data = {**BASE_ENTRY, "config": {"transport": transport}}
         errors = RegistrySchema.validate_server_entry(data)
-        assert "config.url" in errors
+        assert missing_field in errors
     
     def test_parse_server_entry_minimal(self):
         """Test parsing minimal server entry."""
-        data = {
-            "name": "Test Server",
-            "description": "Test description",
-            "version": "1.0.0",
-            "deployment": "local",
-            "config": {
-                "transport": "stdio",
-                "command": "python",
-                "args": ["server.py"]
-            }
-        }
-        
-        server = RegistrySchema.parse_server_entry(data)
+        server = RegistrySchema.parse_server_entry(BASE_ENTRY)
         assert server.name == "Test Server"
         assert server.description == "Test description"
         assert server.version == "1.0.0"
@@ -123,63 +162,15 @@ class TestRegistrySchema:
         assert server.config.command == "python"
         assert server.config.args == ["server.py"]
     
-    def test_parse_server_entry_full(self):
+    def test_parse_server_entry_full(self, full_server):
         """Test parsing full server entry with all optional fields."""
-        data = {
-            "name": "Full Server",
-            "description": "Full description",
-            "version": "2.1.0",
-            "license": "MIT",
-            "source_url": "https://github.com/example/server",
-            "deployment": "local",
-            "config": {
-                "transport": "stdio",
-                "command": "python",
-                "args": ["server.py"],
-                "env": {"KEY": "value"},
-                "working_dir": "/path",
-                "timeout": 60
-            },
-            "capabilities": {
-                "tools": ["tool1", "tool2"],
-                "resources": ["res1", "res2"],
-                "prompts": ["prompt1"]
-            },
-            "requirements": {
-                "platforms": ["linux", "darwin"],
-                "runtimes": {"python": ">=3.8"},
-                "dependencies": ["requests"],
-                "network": True
-            },
-            "security": {
-                "requires_auth": True,
-                "permissions": ["fs.read"],
-                "sandbox": True
-            },
-            "compatibility": {
-                "claude_desktop": ">=0.10.0",
-                "mcpconf": ">=1.0.0"
-            }
-        }
-        
-        server = RegistrySchema.parse_server_entry(data)
-        assert server.license == "MIT"
-        assert server.source_url == "https://github.com/example/server"
-        assert server.config.env == {"KEY": "value"}
-        assert server.config.working_dir == "/path"
-        assert server.config.timeout == 60
-        assert server.capabilities.tools == ["tool1", "tool2"]
-        assert server.capabilities.resources == ["res1", "res2"]
-        assert server.capabilities.prompts == ["prompt1"]
-        assert server.requirements.platforms == ["linux", "darwin"]
-        assert server.requirements.runtimes == {"python": ">=3.8"}
-        assert server.requirements.dependencies == ["requests"]
-        assert server.requirements.network is True
-        assert server.security.requires_auth is True
-        assert server.security.permissions == ["fs.read"]
-        assert server.security.sandbox is True
-        assert server.compatibility.claude_desktop == ">=0.10.0"
-        assert server.compatibility.mcpconf == ">=1.0.0"
+        assert full_server.license == "MIT"
+        assert full_server.source_url == "https://github.com/example/server"
+        assert asdict(full_server.config) == EXPECTED_FULL["config"]
+        assert asdict(full_server.capabilities) == EXPECTED_FULL["capabilities"]
+        assert asdict(full_server.requirements) == EXPECTED_FULL["requirements"]
+        assert asdict(full_server.security) == EXPECTED_FULL["security"]
+        assert asdict(full_server.compatibility) == EXPECTED_FULL["compatibility"]
     
     def test_parse_registry_valid(self):
         """Test parsing valid registry."""